@@ -1,16 +1,60 @@
+import time
+_STARTUP = time.perf_counter()
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, colorchooser, simpledialog
+from tkinter import ttk, messagebox
 import json
 import os
-from datetime import datetime
-try:
-    from tkcalendar import Calendar
-except ImportError:
-    Calendar = None
+import re
+import sys
+import threading
+import queue
+import random
+from collections import deque, namedtuple
+import mmap
+import struct
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, date
+from functools import lru_cache
+from contextlib import contextmanager
 
 SAVE_FILE = "tasks.brn"
 CONFIG_FILE = "taskbarn_config.json"
+JOURNAL_COMPACT_BYTES = 256 * 1024
+BRN2_MAGIC = b"BRN\x02"
+BRN2_VERSION = 4
 #COLUMNS = 3
+VIRTUAL_BOARD_THRESHOLD = 60
+VIRTUAL_OVERSCAN = 400
+VIRTUAL_HEADER_HEIGHT = 120
+VIRTUAL_ROW_HEIGHT = 56
+TASK_WIDTH_ESTIMATE = 300
+ITEM_PAGE_SIZE = 100
+ITEM_BATCH_SIZE = 25
+FLASH_INTERVAL = 400
+LOAD_FIRST_GROUPS = 12
+MAX_LIVE_BOARDS = 3
+LOAD_BATCH_SECONDS = 0.03
+AUTOSAVE_DELAY_MS = 2000
+AUTOSAVE_POLL_MS = 50
+CHECKED_TEXT_COLOR = "#808080"
+TRACE_FILE = "taskbarn_trace.json"
+TRACE_EVENTS = 50000
+LATENCY_BUCKETS_MS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+OVERLAY_REFRESH_MS = 500
+UNDO_MEMORY_KB = 4096
+ARCHIVE_SUFFIX = ".archive"
+ARCHIVE_AFTER_DAYS = 14
+ARCHIVE_PAGE_SIZE = 50
+WATCH_POLL_MS = 1000
+SQLITE_MAGIC = b"SQLite format 3\x00"
+DUE_SOON_DAYS = 7
+WATCH_INOTIFY_POLL_MS = 10000
+WATCH_DEBOUNCE_MS = 200
+
+APP_THEMES = {
+    "light": {"bg": "#f0f0f0", "fg": "#000000", "field": "#ffffff", "border": "#bbbbbb"},
+    "dark": {"bg": "#2b2b2b", "fg": "#e6e6e6", "field": "#3c3f41", "border": "#555555"},
+}
 
 SORT_OPTIONS = [
     ("Time Left", "time_left"),
@@ -18,22 +62,2172 @@ SORT_OPTIONS = [
     ("Name", "name"),
     ("Date Created", "created")
 ]
+SORT_MODES = dict(SORT_OPTIONS)
+SORT_MODES.update((value, value) for _, value in SORT_OPTIONS)
+SORT_KEY_INPUTS = {
+    "title": ("time_left", "size", "name", "created"),
+    "due_date": ("time_left",),
+    "items": ("size",),
+}
 
-class Task:
-    def __init__(self, root, title, remove_callback=None, checkboxes=None, dirty_callback=None, due_date=None, color=None, created=None):
+GROUP_ADDED = "group_added"
+GROUP_REMOVED = "group_removed"
+GROUP_TITLE = "group_title"
+GROUP_COLOR = "group_color"
+GROUP_DEADLINE = "group_deadline"
+GROUP_COLLAPSED = "group_collapsed"
+ITEM_ADDED = "item_added"
+ITEM_REMOVED = "item_removed"
+ITEM_TEXT = "item_text"
+ITEM_CHECKED = "item_checked"
+ITEM_DEADLINE = "item_deadline"
+
+ChangeEvent = namedtuple("ChangeEvent", "kind group_id item_id")
+
+@lru_cache(maxsize=None)
+def load_calendar():
+    try:
+        from tkcalendar import Calendar
+    except ImportError:
+        return None
+    return Calendar
+
+class StartupProfile:
+    def __init__(self, start):
+        self.start = start
+        self.last = start
+        self.phases = []
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+
+    def report(self):
+        lines = ["Startup profile:"]
+        for name, seconds in self.phases:
+            lines.append(f"  {name:<18} {seconds * 1000:8.1f} ms")
+        lines.append(f"  {'total':<18} {(self.last - self.start) * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+def new_id(reserved=None):
+    if reserved is None:
+        return random.getrandbits(63)
+    return reserved
+
+def parse_checkbox_data(cb_data):
+    if isinstance(cb_data, (list, tuple)) and len(cb_data) >= 2:
+        label = cb_data[0]
+        checked = cb_data[1]
+        deadline = cb_data[2] if len(cb_data) > 2 else ""
+        done_on = parse_done_date(cb_data[3]) if len(cb_data) > 3 else None
+        return label, checked, deadline or "", done_on
+    return None
+
+def parse_done_date(text):
+    try:
+        return date.fromisoformat(text).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+@lru_cache(maxsize=4096)
+def parse_due_date(text):
+    if not text:
+        return None
+    try:
+        return datetime.strptime(text, "%m/%d/%y").toordinal()
+    except (TypeError, ValueError):
+        return None
+
+def days_until(ordinal):
+    return ordinal - date.today().toordinal()
+
+class Item:
+    __slots__ = ("id", "label", "checked", "_deadline", "deadline_ord", "done_on")
+
+    def __init__(self, label="", checked=False, deadline="", done_on=None, id=None):
+        self.id = new_id(id)
+        self.label = label
+        self.checked = bool(checked)
+        self.deadline = deadline
+        self.done_on = done_on if checked else None
+
+    @property
+    def deadline(self):
+        return self._deadline
+
+    @deadline.setter
+    def deadline(self, value):
+        self._deadline = value or ""
+        self.deadline_ord = parse_due_date(self._deadline)
+
+    def to_data(self):
+        if self.done_on is None:
+            return (self.label, self.checked, self._deadline)
+        return (self.label, self.checked, self._deadline, date.fromordinal(self.done_on).isoformat())
+
+def _time_left_key(group):
+    due = group.due_ord
+    return (float('inf') if due is None else due, group.title.lower(), group.created)
+
+SORT_KEYS = {
+    "time_left": _time_left_key,
+    "size": lambda g: (-g.item_count(), g.title.lower(), g.created),
+    "name": lambda g: (g.title.lower(), g.created),
+    "created": lambda g: (g.created, g.title.lower()),
+}
+
+class Descending:
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        return isinstance(other, Descending) and self.key == other.key
+
+class SortIndex:
+    def __init__(self, groups, mode="created", descending=False):
+        self.groups = groups
+        self.keys = []
+        self.stored = {}
+        self.moves = []
+        self.rebuild(mode, descending)
+
+    def key(self, group):
+        key = group.sort_key(self.mode) + (group.id,)
+        return Descending(key) if self.descending else key
+
+    def rebuild(self, mode=None, descending=None):
+        if mode is not None:
+            self.mode = mode
+        if descending is not None:
+            self.descending = descending
+        decorated = sorted(((self.key(group), group) for group in self.groups), key=lambda pair: pair[0])
+        self.groups[:] = [group for _, group in decorated]
+        self.keys = [key for key, _ in decorated]
+        self.stored = {group.id: key for key, group in decorated}
+        self.moves = []
+
+    def depends_on(self, field):
+        return self.mode in SORT_KEY_INPUTS[field]
+
+    def insert(self, group):
+        key = self.stored[group.id] = self.key(group)
+        index = bisect_right(self.keys, key)
+        self.keys.insert(index, key)
+        self.groups.insert(index, group)
+        return index
+
+    def remove(self, group):
+        key = self.stored.pop(group.id, None)
+        if key is None:
+            return None
+        index = bisect_left(self.keys, key)
+        del self.keys[index]
+        del self.groups[index]
+        return index
+
+    def update(self, group):
+        key = self.key(group)
+        if self.stored.get(group.id) == key:
+            return None
+        old = self.remove(group)
+        new = self.insert(group)
+        if old == new:
+            return None
+        self.moves.append((group, old, new))
+        return old, new
+
+    def take_moves(self):
+        moves, self.moves = self.moves, []
+        return moves
+
+class Group:
+    __slots__ = ("id", "_title", "_items", "_source", "_counts", "_due_date", "due_ord", "color", "created", "collapsed", "_sort_keys")
+
+    def __init__(self, title, items=None, due_date="", color=None, created=None, id=None, collapsed=False):
+        self.id = new_id(id)
+        self._sort_keys = {}
         self.title = title
-        self.remove_callback = remove_callback
-        self.dirty_callback = dirty_callback
-        self.checkboxes = []
-        self.due_date = due_date or ""
+        self.items = list(items) if items else []
+        self.due_date = due_date
         self.color = color or "#ffffff"
         self.created = created or datetime.now().isoformat()
+        self.collapsed = bool(collapsed)
+
+    @classmethod
+    def lazy(cls, source, item_count, done_count, **fields):
+        group = cls(**fields)
+        group._items = None
+        group._source = source
+        group._counts = (item_count, done_count)
+        return group
+
+    @property
+    def items(self):
+        if self._items is None:
+            self._items = self._source()
+            self._source = None
+        return self._items
+
+    @items.setter
+    def items(self, value):
+        self._items = value
+        self._source = None
+
+    def is_loaded(self):
+        return self._items is not None
+
+    def item_count(self):
+        if self._items is None:
+            return self._counts[0]
+        return len(self._items)
+
+    @property
+    def title(self):
+        return self._title
+
+    @title.setter
+    def title(self, value):
+        self._title = value
+        self.invalidate("title")
+
+    @property
+    def due_date(self):
+        return self._due_date
+
+    @due_date.setter
+    def due_date(self, value):
+        self._due_date = value or ""
+        self.due_ord = parse_due_date(self._due_date)
+        self.invalidate("due_date")
+
+    def invalidate(self, field):
+        for mode in SORT_KEY_INPUTS[field]:
+            self._sort_keys.pop(mode, None)
+
+    def sort_key(self, mode):
+        key = self._sort_keys.get(mode)
+        if key is None:
+            key = self._sort_keys[mode] = SORT_KEYS[mode](self)
+        return key
+
+    def done_count(self):
+        if self._items is None:
+            return self._counts[1]
+        return sum(1 for item in self._items if item.checked)
+
+    def add_item(self, label="", checked=False, deadline=""):
+        item = Item(label, checked, deadline)
+        self.items.append(item)
+        self.invalidate("items")
+        return item
+
+    def insert_item(self, index, item):
+        self.items.insert(index, item)
+        self.invalidate("items")
+        return item
+
+    def remove_item(self, item):
+        try:
+            self.items.remove(item)
+        except ValueError:
+            return
+        self.invalidate("items")
+
+    def find_item(self, item_id):
+        for item in self.items:
+            if item.id == item_id:
+                return item
+        return None
+
+    def to_data(self):
+        return {
+            "id": self.id,
+            "title": self.title,
+            "checkboxes": [item.to_data() for item in self.items],
+            "due_date": self.due_date,
+            "color": self.color,
+            "created": self.created,
+            "collapsed": self.collapsed
+        }
+
+    @classmethod
+    def from_data(cls, data, id=None):
+        items = []
+        for cb_data in data.get("checkboxes", []):
+            parsed = parse_checkbox_data(cb_data)
+            if parsed is None:
+                print(f"Skipping invalid checkbox data: {cb_data}")
+                continue
+            items.append(Item(*parsed))
+        if id is None and isinstance(data.get("id"), int):
+            id = data["id"]
+        return cls(
+            data["title"],
+            id=id,
+            items=items,
+            due_date=data.get("due_date", ""),
+            color=data.get("color", "#ffffff"),
+            created=data.get("created"),
+            collapsed=data.get("collapsed", False)
+        )
+
+class ChangeBus:
+    def __init__(self, root=None):
+        self.root = root
+        self.subscribers = []
+        self.pending = {}
+        self._job = None
+
+    def subscribe(self, callback, kinds=None):
+        self.subscribers.append((callback, frozenset(kinds) if kinds else None))
+
+    def publish(self, kind, group_id, item_id=None):
+        event = ChangeEvent(kind, group_id, item_id)
+        self.pending.pop(event, None)
+        self.pending[event] = event
+        if self.root is None:
+            self.flush()
+        elif self._job is None:
+            self._job = self.root.after_idle(self.flush)
+
+    def flush(self):
+        self._job = None
+        events = list(self.pending)
+        self.pending.clear()
+        if not events:
+            return
+        for callback, kinds in self.subscribers:
+            selected = events if kinds is None else [e for e in events if e.kind in kinds]
+            if selected:
+                callback(selected)
+
+    def cancel(self):
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+        self.pending.clear()
+
+class Board:
+    __slots__ = ("groups", "bus", "dirty_groups", "history", "order")
+
+    def __init__(self, groups=None, bus=None, history=None):
+        self.groups = list(groups) if groups else []
+        self.bus = bus
+        self.dirty_groups = set()
+        self.history = history
+        self.order = None
+
+    def sort(self, mode, descending=False):
+        if self.order is None:
+            self.order = SortIndex(self.groups, mode, descending)
+        elif self.order.mode != mode or self.order.descending != descending:
+            self.order.rebuild(mode, descending)
+        return self.order
+
+    def reorder(self, group, field):
+        if self.order is not None and self.order.depends_on(field):
+            self.order.update(group)
+
+    def changed(self, kind, group, item=None):
+        self.dirty_groups.add(group.id)
+        if self.bus is not None:
+            self.bus.publish(kind, group.id, item.id if item is not None else None)
+
+    def record(self, delta):
+        if self.history is not None:
+            self.history.record(delta)
+
+    @contextmanager
+    def untracked(self):
+        history = self.history
+        self.history = None
+        try:
+            yield
+        finally:
+            self.history = history
+
+    def find_group(self, group_id):
+        for group in self.groups:
+            if group.id == group_id:
+                return group
+        return None
+
+    def add_group(self, group, index=None):
+        if self.order is not None:
+            index = self.order.insert(group)
+        else:
+            if index is None:
+                index = len(self.groups)
+            self.groups.insert(index, group)
+        self.changed(GROUP_ADDED, group)
+        self.record(("add_group", index, group))
+        return group
+
+    def remove_group(self, group):
+        if self.history is not None:
+            group.items
+        if self.order is not None:
+            index = self.order.remove(group)
+            if index is None:
+                return
+        else:
+            try:
+                index = self.groups.index(group)
+            except ValueError:
+                return
+            del self.groups[index]
+        self.changed(GROUP_REMOVED, group)
+        self.record(("remove_group", index, group))
+
+    def set_title(self, group, title):
+        self.record(("title", group.id, group.title, title))
+        group.title = title
+        self.reorder(group, "title")
+        self.changed(GROUP_TITLE, group)
+
+    def set_color(self, group, color):
+        self.record(("color", group.id, group.color, color))
+        group.color = color
+        self.changed(GROUP_COLOR, group)
+
+    def set_due_date(self, group, due_date):
+        self.record(("due", group.id, group.due_date, due_date))
+        group.due_date = due_date
+        self.reorder(group, "due_date")
+        self.changed(GROUP_DEADLINE, group)
+
+    def set_collapsed(self, group, collapsed):
+        group.collapsed = collapsed
+        self.changed(GROUP_COLLAPSED, group)
+
+    def add_item(self, group, label="", checked=False, deadline=""):
+        item = group.add_item(label, checked, deadline)
+        self.reorder(group, "items")
+        self.changed(ITEM_ADDED, group, item)
+        self.record(("add_item", group.id, group.item_count() - 1, item))
+        return item
+
+    def insert_item(self, group, index, item):
+        group.insert_item(index, item)
+        self.reorder(group, "items")
+        self.changed(ITEM_ADDED, group, item)
+        self.record(("add_item", group.id, index, item))
+        return item
+
+    def remove_item(self, group, item):
+        try:
+            index = group.items.index(item)
+        except ValueError:
+            return
+        group.remove_item(item)
+        self.reorder(group, "items")
+        self.changed(ITEM_REMOVED, group, item)
+        self.record(("remove_item", group.id, index, item))
+
+    def set_item_text(self, group, item, label):
+        self.record(("text", group.id, item.id) + text_diff(item.label, label))
+        item.label = label
+        self.changed(ITEM_TEXT, group, item)
+
+    def set_item_checked(self, group, item, checked):
+        self.record(("checked", group.id, item.id, item.checked, bool(checked)))
+        item.checked = bool(checked)
+        item.done_on = date.today().toordinal() if checked else None
+        self.changed(ITEM_CHECKED, group, item)
+
+    def set_item_deadline(self, group, item, deadline):
+        self.record(("deadline", group.id, item.id, item.deadline, deadline or ""))
+        item.deadline = deadline
+        self.changed(ITEM_DEADLINE, group, item)
+
+    def apply_delta(self, delta, undo=True):
+        kind = delta[0]
+        if kind in ("add_group", "remove_group"):
+            _, index, group = delta
+            if (kind == "add_group") == undo:
+                self.remove_group(group)
+            else:
+                self.add_group(group, min(index, len(self.groups)))
+            return group
+        group = self.find_group(delta[1])
+        if group is None:
+            return None
+        if kind in ("title", "color", "due"):
+            setter = {"title": self.set_title, "color": self.set_color, "due": self.set_due_date}[kind]
+            setter(group, delta[2] if undo else delta[3])
+            return group
+        if kind in ("add_item", "remove_item"):
+            _, _, index, item = delta
+            if (kind == "add_item") == undo:
+                self.remove_item(group, item)
+            else:
+                self.insert_item(group, min(index, group.item_count()), item)
+            return group
+        item = group.find_item(delta[2])
+        if item is None:
+            return None
+        if kind == "text":
+            _, _, _, pos, removed, inserted = delta
+            old, new = (inserted, removed) if undo else (removed, inserted)
+            self.set_item_text(group, item, item.label[:pos] + new + item.label[pos + len(old):])
+        elif kind == "checked":
+            self.set_item_checked(group, item, delta[3] if undo else delta[4])
+        elif kind == "deadline":
+            self.set_item_deadline(group, item, delta[3] if undo else delta[4])
+        return group
+
+    def take_dirty(self):
+        dirty = self.dirty_groups
+        self.dirty_groups = set()
+        return dirty
+
+    def to_data(self):
+        return [group.to_data() for group in self.groups]
+
+    def load_all(self):
+        for group in self.groups:
+            group.items
+
+    @classmethod
+    def from_data(cls, data):
+        groups = []
+        seen = set()
+        for item in data:
+            group = Group.from_data(item)
+            if group.id in seen:
+                group.id = new_id()
+            seen.add(group.id)
+            groups.append(group)
+        return cls(groups)
+
+def text_diff(old, new):
+    limit = min(len(old), len(new))
+    start = 0
+    while start < limit and old[start] == new[start]:
+        start += 1
+    end = 0
+    while end < limit - start and old[-1 - end] == new[-1 - end]:
+        end += 1
+    return start, old[start:len(old) - end], new[start:len(new) - end]
+
+def delta_size(delta):
+    size = 64
+    for value in delta:
+        if isinstance(value, str):
+            size += 49 + len(value)
+        elif isinstance(value, Item):
+            size += 120 + len(value.label)
+        elif isinstance(value, Group):
+            size += 300 + 120 * value.item_count()
+    return size
+
+def _merge_text(prev, delta):
+    if prev[0] != "text" or prev[1:3] != delta[1:3]:
+        return None
+    _, group_id, item_id, pos, removed, inserted = prev
+    _, _, _, new_pos, new_removed, new_inserted = delta
+    if not new_removed and new_pos == pos + len(inserted):
+        return ("text", group_id, item_id, pos, removed, inserted + new_inserted)
+    if not new_inserted and not inserted and new_pos + len(new_removed) == pos:
+        return ("text", group_id, item_id, new_pos, new_removed + removed, "")
+    if not new_inserted and not inserted and new_pos == pos:
+        return ("text", group_id, item_id, pos, removed + new_removed, "")
+    return None
+
+def _ends_word(delta):
+    _, _, _, _, removed, inserted = delta
+    return inserted[-1:].isspace() or removed[:1].isspace()
+
+class UndoHistory:
+    def __init__(self, limit_bytes=UNDO_MEMORY_KB * 1024):
+        self.limit_bytes = limit_bytes
+        self.undo_stack = deque()
+        self.redo_stack = []
+        self.bytes = 0
+        self.applying = False
+        self._open_word = False
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack = []
+        self.bytes = 0
+        self._open_word = False
+
+    def seal(self):
+        self._open_word = False
+
+    def record(self, delta):
+        if self.applying:
+            return
+        for old in self.redo_stack:
+            self.bytes -= delta_size(old)
+        self.redo_stack = []
+        if delta[0] == "text":
+            if delta[4] == delta[5]:
+                return
+            if self._open_word and self.undo_stack:
+                merged = _merge_text(self.undo_stack[-1], delta)
+                if merged is not None:
+                    self.bytes += delta_size(merged) - delta_size(self.undo_stack[-1])
+                    self.undo_stack[-1] = merged
+                    self._open_word = not _ends_word(merged)
+                    return
+            self._open_word = not _ends_word(delta)
+        else:
+            self._open_word = False
+        self.undo_stack.append(delta)
+        self.bytes += delta_size(delta)
+        while self.bytes > self.limit_bytes and len(self.undo_stack) > 1:
+            self.bytes -= delta_size(self.undo_stack.popleft())
+
+    def _apply(self, board, source, target, undo):
+        if not source:
+            return None
+        delta = source.pop()
+        self.applying = True
+        try:
+            board.apply_delta(delta, undo)
+        finally:
+            self.applying = False
+        target.append(delta)
+        self._open_word = False
+        return delta
+
+    def undo(self, board):
+        return self._apply(board, self.undo_stack, self.redo_stack, True)
+
+    def redo(self, board):
+        return self._apply(board, self.redo_stack, self.undo_stack, False)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+def tokenize(text):
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
+class SearchIndex:
+    def __init__(self, board):
+        self.board = board
+        self.groups = {}
+        self.postings = {}
+        self.vocab = []
+        self.key_tokens = {}
+        self.group_keys = {}
+        self._last = None
+        for group in board.groups:
+            self.add_group(group)
+
+    def _post(self, token, key):
+        keys = self.postings.get(token)
+        if keys is None:
+            keys = self.postings[token] = set()
+            insort(self.vocab, token)
+        keys.add(key)
+
+    def _unpost(self, token, key):
+        keys = self.postings.get(token)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del self.postings[token]
+            del self.vocab[bisect_left(self.vocab, token)]
+
+    def _index(self, key, text):
+        old = self.key_tokens.get(key, frozenset())
+        new = tokenize(text)
+        for token in old - new:
+            self._unpost(token, key)
+        for token in new - old:
+            self._post(token, key)
+        self.key_tokens[key] = new
+        self.group_keys.setdefault(key[0], set()).add(key)
+        self._last = None
+
+    def _drop(self, key):
+        for token in self.key_tokens.pop(key, ()):
+            self._unpost(token, key)
+        keys = self.group_keys.get(key[0])
+        if keys:
+            keys.discard(key)
+        self._last = None
+
+    def add_group(self, group):
+        self.groups[group.id] = group
+        self._index((group.id, None), group.title)
+        for item in group.items:
+            self._index((group.id, item.id), item.label)
+
+    def remove_group(self, group_id):
+        self.groups.pop(group_id, None)
+        for key in list(self.group_keys.pop(group_id, ())):
+            self._drop(key)
+
+    def apply(self, events):
+        for event in events:
+            group_id = event.group_id
+            if event.kind in (GROUP_REMOVED, GROUP_ADDED) or group_id not in self.groups:
+                group = self.board.find_group(group_id)
+                if group is not self.groups.get(group_id):
+                    self.remove_group(group_id)
+                    if group is not None:
+                        self.add_group(group)
+            elif event.kind == GROUP_TITLE:
+                self._index((group_id, None), self.groups[group_id].title)
+            elif event.kind in (ITEM_ADDED, ITEM_REMOVED, ITEM_TEXT):
+                key = (group_id, event.item_id)
+                for item in self.groups[group_id].items:
+                    if item.id == event.item_id:
+                        self._index(key, item.label)
+                        break
+                else:
+                    self._drop(key)
+
+    def _lookup(self, term):
+        vocab = self.vocab
+        start = bisect_left(vocab, term)
+        end = bisect_left(vocab, term + "\uffff", start)
+        if end - start == 1:
+            return set(self.postings[vocab[start]])
+        keys = set()
+        for token in vocab[start:end]:
+            keys.update(self.postings[token])
+        return keys
+
+    def search(self, query):
+        terms = tokenize(query)
+        if not terms:
+            return None
+        last = self._last
+        keys = None
+        if last is not None and all(any(t.startswith(p) for t in terms) for p in last[0]):
+            keys = last[1]
+            terms = terms - last[0]
+        for term in sorted(terms, key=len, reverse=True):
+            if keys is not None and not keys:
+                break
+            found = self._lookup(term)
+            keys = found if keys is None else keys & found
+        self._last = (tokenize(query), keys)
+
+        result = {}
+        for group_id, item_id in keys:
+            if item_id is None:
+                result[group_id] = None
+            elif result.get(group_id, ()) is not None:
+                result.setdefault(group_id, set()).add(item_id)
+        return result
+
+def atomic_write(path, text):
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with (open(tmp_path, "wb") if isinstance(text, bytes) else open(tmp_path, "w", encoding="utf-8")) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def compact_json(data):
+    return json.dumps(data, separators=(",", ":"))
+
+class JsonStore:
+    def __init__(self, path):
+        self.path = path
+        self.write_lock = threading.Lock()
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def load(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            return Board.from_data(json.load(f))
+
+    def loaded(self, board):
+        board.take_dirty()
+
+    def reloaded(self, disk_board):
+        pass
+
+    def snapshot(self, board):
+        board.take_dirty()
+        return board.to_data()
+
+    def write(self, data):
+        with self.write_lock:
+            self._write(data)
+
+    def _write(self, data):
+        atomic_write(self.path, json.dumps(data, indent=2))
+
+    def save(self, board):
+        self.write(self.snapshot(board))
+
+    def wait(self):
+        pass
+
+    def close(self):
+        pass
+
+def journal_paths(path):
+    return path + ".log", path + ".log.compacting"
+
+def is_journal(path):
+    return any(os.path.exists(p) for p in journal_paths(path))
+
+class JournalStore(JsonStore):
+    def __init__(self, path, compact_bytes=JOURNAL_COMPACT_BYTES):
+        super().__init__(path)
+        self.log_path, self.compacting_path = journal_paths(path)
+        self.compact_bytes = compact_bytes
+        self.saved = None
+        self.legacy = False
+        self.compactions = 0
+        self._compact_next = False
+        self._retry = set()
+        self._lock = threading.Lock()
+        self._compactor = None
+        self._torn = {}
+
+    def exists(self):
+        return any(os.path.exists(p) for p in (self.path, self.log_path, self.compacting_path))
+
+    def load(self):
+        groups = {}
+        self.legacy = False
+        self._torn = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            for data in snapshot:
+                if not isinstance(data.get("id"), int):
+                    self.legacy = True
+                groups[data.get("id", object())] = data
+        self._replay(self.compacting_path, groups)
+        self._replay(self.log_path, groups)
+        return Board.from_data(groups.values())
+
+    def _replay(self, path, groups):
+        if not os.path.exists(path):
+            return
+        complete = 0
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if record.get("op") == "put":
+                    group = record["group"]
+                    groups[group["id"]] = group
+                elif record.get("op") == "del":
+                    groups.pop(record["id"], None)
+                complete += len(line)
+            if f.seek(0, os.SEEK_END) > complete:
+                self._torn[path] = complete
+
+    def _cut_torn_tail(self):
+        for path, complete in self._torn.items():
+            try:
+                with open(path, "r+b") as f:
+                    f.truncate(complete)
+            except OSError:
+                pass
+        self._torn = {}
+
+    def loaded(self, board):
+        board.take_dirty()
+        if self.legacy:
+            self.saved = None
+        else:
+            self.saved = {group.id: compact_json(group.to_data()) for group in board.groups}
+
+    def reloaded(self, disk_board):
+        if self.saved is not None:
+            self.wait()
+            self.saved = {group.id: compact_json(group.to_data()) for group in disk_board.groups}
+
+    def snapshot(self, board):
+        dirty = board.take_dirty() | self._retry
+        self._retry = set()
+        if self.saved is None or self._compact_next:
+            return board.to_data()
+        return {
+            "ids": [group.id for group in board.groups],
+            "changed": [group.to_data() for group in board.groups if group.id in dirty],
+        }
+
+    def _write(self, data):
+        if isinstance(data, dict):
+            changed = data["changed"]
+            try:
+                self._append(changed, set(data["ids"]))
+            except Exception:
+                self._retry.update(group["id"] for group in changed)
+                raise
+            if self._log_size() > self.compact_bytes:
+                self._compact_next = True
+            return
+
+        if self.saved is None:
+            self.wait()
+            with self._lock:
+                super()._write(data)
+                self._remove_logs()
+            self.legacy = False
+            self.saved = {group["id"]: compact_json(group) for group in data}
+            return
+
+        self._append(data, {group["id"] for group in data})
+        if self._log_size() > self.compact_bytes:
+            self._compact_next = False
+            self.compact(data)
+
+    def _append(self, changed, ids):
+        records = []
+        encoded_groups = {}
+        for group in changed:
+            encoded = compact_json(group)
+            if self.saved.get(group["id"]) != encoded:
+                encoded_groups[group["id"]] = encoded
+                records.append('{"op":"put","group":%s}\n' % encoded)
+        removed = [group_id for group_id in self.saved if group_id not in ids]
+        for group_id in removed:
+            records.append(compact_json({"op": "del", "id": group_id}) + "\n")
+
+        if records:
+            with self._lock:
+                self._cut_torn_tail()
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write("".join(records))
+                    f.flush()
+                    os.fsync(f.fileno())
+        self.saved.update(encoded_groups)
+        for group_id in removed:
+            del self.saved[group_id]
+
+    def _log_size(self):
+        try:
+            return os.path.getsize(self.log_path)
+        except OSError:
+            return 0
+
+    def compact(self, data):
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        with self._lock:
+            self._cut_torn_tail()
+            if os.path.exists(self.compacting_path):
+                with open(self.log_path, "r", encoding="utf-8") as src, open(self.compacting_path, "a", encoding="utf-8") as dst:
+                    dst.write(src.read())
+                os.remove(self.log_path)
+            else:
+                os.replace(self.log_path, self.compacting_path)
+        self._compactor = threading.Thread(target=self._write_snapshot, args=(data,), daemon=True)
+        self._compactor.start()
+
+    def _write_snapshot(self, data):
+        atomic_write(self.path, json.dumps(data, indent=2))
+        with self._lock:
+            try:
+                os.remove(self.compacting_path)
+            except OSError:
+                pass
+            self.compactions += 1
+
+    def _remove_logs(self):
+        self._torn = {}
+        for path in (self.log_path, self.compacting_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def wait(self):
+        if self._compactor is not None:
+            self._compactor.join()
+
+_BRN2_HEADER = struct.Struct("<4sHHIQQ")
+_BRN2_INDEX = struct.Struct("<QIQIIIIIIB")
+_BRN2_INDEX_V3 = struct.Struct("<QIIIIIIIIB")
+_BRN2_ITEM = struct.Struct("<BII")
+_BRN2_COUNT = struct.Struct("<I")
+
+def is_brn2(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(BRN2_MAGIC)) == BRN2_MAGIC
+    except OSError:
+        return False
+
+def encode_brn2(data):
+    strings = {}
+    sid = lambda text: strings.setdefault(text, len(strings))
+    records = []
+    index = []
+    offset = _BRN2_HEADER.size
+    for group in data:
+        parts = []
+        done = 0
+        for cb_data in group["checkboxes"]:
+            label, checked, deadline = cb_data[:3]
+            label = str(label).encode("utf-8")
+            if len(cb_data) > 3:
+                parts.append(_BRN2_ITEM.pack(3 if checked else 2, sid(deadline), len(label)))
+                parts.append(_BRN2_COUNT.pack(sid(cb_data[3])))
+            else:
+                parts.append(_BRN2_ITEM.pack(1 if checked else 0, sid(deadline), len(label)))
+            parts.append(label)
+            done += bool(checked)
+        record = b"".join(parts)
+        index.append(_BRN2_INDEX.pack(
+            offset, len(record), group["id"], len(group["checkboxes"]), done,
+            sid(group["title"]), sid(group["due_date"]), sid(group["color"]), sid(group["created"]),
+            1 if group["collapsed"] else 0
+        ))
+        records.append(record)
+        offset += len(record)
+
+    table = [_BRN2_COUNT.pack(len(strings))]
+    for text in strings:
+        encoded = str(text).encode("utf-8")
+        table.append(_BRN2_COUNT.pack(len(encoded)))
+        table.append(encoded)
+    table = b"".join(table)
+    header = _BRN2_HEADER.pack(BRN2_MAGIC, BRN2_VERSION, 0, len(data), offset, offset + len(table))
+    return b"".join([header] + records + [table] + index)
+
+def write_brn2(path, board):
+    atomic_write(path, encode_brn2(board.to_data()))
+
+class Brn2Reader:
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, _, count, strings_offset, index_offset = _BRN2_HEADER.unpack_from(self.data, 0)
+            if magic != BRN2_MAGIC:
+                raise ValueError("Not a TaskBarn v2 file")
+            if version > BRN2_VERSION:
+                raise ValueError(f"Unsupported TaskBarn file version {version}")
+            self.strings = self._read_strings(strings_offset)
+            layout = _BRN2_INDEX if version >= 4 else _BRN2_INDEX_V3
+            self.index = [layout.unpack_from(self.data, index_offset + i * layout.size) for i in range(count)]
+        except Exception:
+            self.close()
+            raise
+
+    def _read_strings(self, pos):
+        (count,) = _BRN2_COUNT.unpack_from(self.data, pos)
+        pos += _BRN2_COUNT.size
+        strings = []
+        for _ in range(count):
+            (size,) = _BRN2_COUNT.unpack_from(self.data, pos)
+            pos += _BRN2_COUNT.size
+            strings.append(self.data[pos:pos + size].decode("utf-8"))
+            pos += size
+        return strings
+
+    def read_items(self, i):
+        pos, _, _, count = self.index[i][:4]
+        data = self.data
+        strings = self.strings
+        items = []
+        for _ in range(count):
+            flags, deadline, size = _BRN2_ITEM.unpack_from(data, pos)
+            pos += _BRN2_ITEM.size
+            done_on = None
+            if flags & 2:
+                (done,) = _BRN2_COUNT.unpack_from(data, pos)
+                pos += _BRN2_COUNT.size
+                done_on = parse_done_date(strings[done])
+            items.append(Item(data[pos:pos + size].decode("utf-8"), flags & 1, strings[deadline], done_on))
+            pos += size
+        return items
+
+    def group(self, i):
+        _, _, group_id, count, done, title, due, color, created, flags = self.index[i]
+        s = self.strings
+        return Group.lazy(
+            lambda: self.read_items(i), count, done,
+            title=s[title], due_date=s[due], color=s[color], created=s[created],
+            id=group_id, collapsed=bool(flags & 1)
+        )
+
+    def board(self):
+        return Board(self.group(i) for i in range(len(self.index)))
+
+    def close(self):
+        data = getattr(self, "data", None)
+        if data is not None:
+            data.close()
+            self.data = None
+        self.file.close()
+
+class Brn2Store(JsonStore):
+    def __init__(self, path):
+        super().__init__(path)
+        self.reader = None
+
+    def load(self):
+        self.close()
+        self.reader = Brn2Reader(self.path)
+        return self.reader.board()
+
+    def snapshot(self, board):
+        board.take_dirty()
+        data = board.to_data()
+        self.close()
+        return data
+
+    def _write(self, data):
+        atomic_write(self.path, encode_brn2(data))
+
+    def close(self):
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+
+def is_sqlite(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(SQLITE_MAGIC)) == SQLITE_MAGIC
+    except OSError:
+        return False
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS groups (
+    id INTEGER PRIMARY KEY, title TEXT NOT NULL, due_date TEXT, due_ord INTEGER,
+    color TEXT, created TEXT, collapsed INTEGER
+);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY, group_id INTEGER NOT NULL, position INTEGER NOT NULL, label TEXT,
+    checked INTEGER, deadline TEXT, deadline_ord INTEGER, done_on TEXT
+);
+CREATE INDEX IF NOT EXISTS items_group ON items (group_id, position);
+CREATE INDEX IF NOT EXISTS items_due ON items (checked, deadline_ord);
+CREATE INDEX IF NOT EXISTS groups_due ON groups (due_ord);
+CREATE INDEX IF NOT EXISTS groups_created ON groups (created);
+"""
+
+def group_row(group):
+    return (group.id, group.title, group.due_date, group.due_ord, group.color, group.created, int(group.collapsed))
+
+def item_rows(group_id, items):
+    return {
+        item.id: (item.id, group_id, position, item.label, int(item.checked), item.deadline, item.deadline_ord,
+                  None if item.done_on is None else date.fromordinal(item.done_on).isoformat())
+        for position, item in enumerate(items)
+    }
+
+class SqliteStore(JsonStore):
+    def __init__(self, path):
+        super().__init__(path)
+        self.log_path = path + "-wal"
+        self.db = None
+        self.saved = None
+        self._retry = set()
+        self._lock = threading.RLock()
+
+    def connect(self):
+        if self.db is None:
+            import sqlite3
+            self.db = sqlite3.connect(self.path, check_same_thread=False)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.executescript(SQLITE_SCHEMA)
+        return self.db
+
+    def load(self):
+        with self._lock:
+            db = self.connect()
+            rows = db.execute(
+                "SELECT g.id, g.title, g.due_date, g.color, g.created, g.collapsed, COUNT(i.id), COALESCE(SUM(i.checked), 0) "
+                "FROM groups g LEFT JOIN items i ON i.group_id = g.id GROUP BY g.id ORDER BY g.created, g.id"
+            ).fetchall()
+        self.saved = {}
+        groups = []
+        for group_id, title, due_date, color, created, collapsed, count, done in rows:
+            group = Group.lazy(
+                lambda group_id=group_id: self.read_items(group_id), count, done,
+                title=title, due_date=due_date, color=color, created=created, id=group_id, collapsed=bool(collapsed)
+            )
+            self.saved[group_id] = (group_row(group), None)
+            groups.append(group)
+        return Board(groups)
+
+    def read_items(self, group_id):
+        with self._lock:
+            rows = self.connect().execute(
+                "SELECT id, label, checked, deadline, done_on FROM items WHERE group_id = ? ORDER BY position", (group_id,)
+            ).fetchall()
+        items = [Item(label, checked, deadline, parse_done_date(done_on), id=item_id)
+                 for item_id, label, checked, deadline, done_on in rows]
+        saved = self.saved.get(group_id) if self.saved is not None else None
+        if saved is not None and saved[1] is None:
+            self.saved[group_id] = (saved[0], item_rows(group_id, items))
+        return items
+
+    def reloaded(self, disk_board):
+        with self._lock:
+            self.saved = {group.id: (group_row(group), item_rows(group.id, group.items)) for group in disk_board.groups}
+
+    def snapshot(self, board):
+        dirty = board.take_dirty() | self._retry
+        self._retry = set()
+        data = {"full": self.saved is None, "changed": [], "removed": [], "groups": [], "new_groups": [],
+                "items": [], "new_items": [], "deleted_items": [], "replace_items": [], "cache": {}}
+        saved = self.saved or {}
+        if data["full"]:
+            dirty = {group.id for group in board.groups}
+        by_id = {group.id: group for group in board.groups if group.id in dirty}
+        for group_id in dirty:
+            group = by_id.get(group_id)
+            old = saved.get(group_id)
+            if group is None:
+                if old is not None:
+                    data["removed"].append(group_id)
+                continue
+            data["changed"].append(group_id)
+            row = group_row(group)
+            if old is None:
+                data["new_groups"].append(row)
+            elif old[0] != row:
+                data["groups"].append(row[1:] + row[:1])
+            if not group.is_loaded():
+                data["cache"][group_id] = (row, old[1] if old else None)
+                continue
+            rows = item_rows(group_id, group.items)
+            old_rows = old[1] if old else {}
+            if old_rows is None:
+                data["replace_items"].append(group_id)
+                data["new_items"].extend(rows.values())
+            else:
+                for item_id, item_row in rows.items():
+                    if item_id not in old_rows:
+                        data["new_items"].append(item_row)
+                    elif old_rows[item_id] != item_row:
+                        data["items"].append(item_row[1:] + item_row[:1])
+                data["deleted_items"].extend((item_id,) for item_id in old_rows if item_id not in rows)
+            data["cache"][group_id] = (row, rows)
+        return data
+
+    def _write(self, data):
+        with self._lock:
+            db = self.connect()
+            try:
+                with db:
+                    if data["full"]:
+                        db.execute("DELETE FROM items")
+                        db.execute("DELETE FROM groups")
+                    removed = [(group_id,) for group_id in data["removed"]]
+                    db.executemany("DELETE FROM items WHERE group_id = ?", removed + [(g,) for g in data["replace_items"]])
+                    db.executemany("DELETE FROM groups WHERE id = ?", removed)
+                    db.executemany("DELETE FROM items WHERE id = ?", data["deleted_items"])
+                    db.executemany(
+                        "UPDATE groups SET title = ?, due_date = ?, due_ord = ?, color = ?, created = ?, collapsed = ? WHERE id = ?",
+                        data["groups"]
+                    )
+                    db.executemany("INSERT OR REPLACE INTO groups VALUES (?, ?, ?, ?, ?, ?, ?)", data["new_groups"])
+                    db.executemany(
+                        "UPDATE items SET group_id = ?, position = ?, label = ?, checked = ?, deadline = ?, "
+                        "deadline_ord = ?, done_on = ? WHERE id = ?",
+                        data["items"]
+                    )
+                    db.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?)", data["new_items"])
+            except Exception:
+                self._retry.update(data["changed"])
+                self._retry.update(data["removed"])
+                raise
+            if data["full"] or self.saved is None:
+                self.saved = {}
+            self.saved.update(data["cache"])
+            for group_id in data["removed"]:
+                self.saved.pop(group_id, None)
+
+    def due_soon(self, days=DUE_SOON_DAYS):
+        today = date.today().toordinal()
+        with self._lock:
+            return self.connect().execute(
+                "SELECT deadline_ord, g.title, i.label FROM items i JOIN groups g ON g.id = i.group_id "
+                "WHERE i.checked = 0 AND i.deadline_ord BETWEEN ? AND ? "
+                "UNION ALL SELECT due_ord, title, NULL FROM groups WHERE due_ord BETWEEN ? AND ? "
+                "ORDER BY 1, 2, 3",
+                (today, today + days, today, today + days)
+            ).fetchall()
+
+    def close(self):
+        with self._lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
+
+def due_soon(board, days=DUE_SOON_DAYS):
+    today = date.today().toordinal()
+    rows = []
+    for group in board.groups:
+        if group.due_ord is not None and today <= group.due_ord <= today + days:
+            rows.append((group.due_ord, group.title, None))
+        for item in group.items:
+            if not item.checked and item.deadline_ord is not None and today <= item.deadline_ord <= today + days:
+                rows.append((item.deadline_ord, group.title, item.label))
+    rows.sort(key=lambda row: (row[0], row[1], row[2] is not None, row[2] or ""))
+    return rows
+
+def import_json(source, target):
+    store = open_store(source, "json", detect=True)
+    board = store.load()
+    board.load_all()
+    store.close()
+    db = SqliteStore(target)
+    db.saved = None
+    db.save(board)
+    db.close()
+    return board
+
+def export_json(source, target):
+    db = SqliteStore(source)
+    board = db.load()
+    board.load_all()
+    db.close()
+    JsonStore(target).save(board)
+    return board
+
+def open_store(path, mode="json", detect=True):
+    if (detect and is_sqlite(path)) or (mode == "sqlite" and not (detect and os.path.exists(path))):
+        return SqliteStore(path)
+    if (detect and is_brn2(path)) or (mode == "binary" and not (detect and os.path.exists(path))):
+        return Brn2Store(path)
+    if mode == "journal" or (detect and is_journal(path)):
+        return JournalStore(path)
+    return JsonStore(path)
+
+def archive_path(path):
+    return path + ARCHIVE_SUFFIX
+
+class ArchiveStore:
+    def __init__(self, path):
+        self.path = path
+        self._offsets = None
 
-        self.container = tk.Frame(root, bg=self.color, highlightbackground="#bbb", highlightthickness=1)
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def append(self, records):
+        if not records:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(compact_json(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._offsets = None
+
+    def offsets(self):
+        if self._offsets is None:
+            offsets = []
+            if self.exists():
+                with open(self.path, "rb") as f:
+                    pos = 0
+                    for line in f:
+                        if line.strip():
+                            offsets.append(pos)
+                        pos += len(line)
+            self._offsets = offsets
+        return self._offsets
+
+    def count(self):
+        return len(self.offsets())
+
+    def page(self, number, size=ARCHIVE_PAGE_SIZE):
+        offsets = self.offsets()
+        end = len(offsets) - number * size
+        wanted = offsets[max(0, end - size):max(0, end)]
+        records = []
+        with open(self.path, "rb") as f:
+            for offset in reversed(wanted):
+                f.seek(offset)
+                try:
+                    records.append((offset, json.loads(f.readline())))
+                except ValueError:
+                    print(f"Skipping invalid archive record at {offset}")
+        return records
+
+    def remove(self, offset):
+        with open(self.path, "rb") as f:
+            data = f.read()
+        end = data.find(b"\n", offset)
+        end = len(data) if end < 0 else end + 1
+        atomic_write(self.path, data[:offset] + data[end:])
+        self._offsets = None
+
+def archive_completed(board, archive, max_age_days=ARCHIVE_AFTER_DAYS):
+    today = date.today()
+    cutoff = today.toordinal() - max_age_days
+    stamp = today.isoformat()
+    records = []
+    moves = []
+    for group in board.groups:
+        if not group.done_count():
+            continue
+        old = []
+        for item in group.items:
+            if item.checked and item.done_on is None:
+                item.done_on = today.toordinal()
+                board.dirty_groups.add(group.id)
+            if item.checked and item.done_on <= cutoff:
+                old.append(item)
+        if not old:
+            continue
+        if len(old) == group.item_count():
+            records.append({"archived": stamp, "group_id": group.id, "group": group.title, "data": group.to_data()})
+            moves.append((group, None))
+        else:
+            for item in old:
+                records.append({"archived": stamp, "group_id": group.id, "group": group.title, "item": item.to_data()})
+            moves.append((group, old))
+    if not records:
+        return []
+    archive.append(records)
+    with board.untracked():
+        for group, items in moves:
+            if items is None:
+                board.remove_group(group)
+            else:
+                for item in items:
+                    board.remove_item(group, item)
+    return moves
+
+def restore_archived(board, record):
+    with board.untracked():
+        if "data" in record:
+            data = record["data"]
+            group = Group.from_data(data, id=new_id() if board.find_group(data.get("id")) else None)
+            for item in group.items:
+                if item.checked:
+                    item.done_on = date.today().toordinal()
+            board.add_group(group)
+            return group, None
+        group = board.find_group(record.get("group_id"))
+        created = group is None
+        if created:
+            group = board.add_group(Group(record.get("group", "Restored")))
+        item = Item(*parse_checkbox_data(record["item"]))
+        if item.checked:
+            item.done_on = date.today().toordinal()
+        item = board.insert_item(group, group.item_count(), item)
+        return group, None if created else item
+
+def group_hash(group):
+    return hash(compact_json(group.to_data()))
+
+def board_hashes(board):
+    return {group.id: group_hash(group) for group in board.groups if group.is_loaded()}
+
+def external_changes(board, disk_board, base, unsaved):
+    local_groups = {group.id: group for group in board.groups}
+    disk_hashes = {}
+    changes = []
+    conflicts = []
+    for group in disk_board.groups:
+        digest = disk_hashes[group.id] = group_hash(group)
+        local = local_groups.pop(group.id, None)
+        if base.get(group.id) == digest:
+            continue
+        if local is not None and group_hash(local) == digest:
+            continue
+        if group.id in unsaved:
+            conflicts.append((local, group))
+        else:
+            changes.append((local, group))
+    for local in local_groups.values():
+        if local.id not in unsaved:
+            changes.append((local, None))
+        elif local.id in base:
+            conflicts.append((local, None))
+    return changes, conflicts, disk_hashes
+
+def store_paths(store):
+    paths = [store.path]
+    for name in ("log_path", "compacting_path"):
+        if hasattr(store, name):
+            paths.append(getattr(store, name))
+    return paths
+
+def inotify_open(directory):
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        # IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        if libc.inotify_add_watch(fd, os.fsencode(directory), 0x2 | 0x8 | 0x80 | 0x100 | 0x200) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+class FileWatcher:
+    def __init__(self, root, callback, interval=WATCH_POLL_MS):
+        self.root = root
+        self.callback = callback
+        self.interval = interval
+        self.paths = ()
+        self.signature = None
+        self._job = None
+        self._fd = None
+
+    def watch(self, paths, signature=None):
+        self.stop()
+        self.paths = tuple(paths)
+        if signature is None:
+            self.sync()
+        else:
+            self.signature = signature
+        fd = inotify_open(os.path.dirname(os.path.abspath(self.paths[0])))
+        if fd is not None:
+            try:
+                self.root.tk.createfilehandler(fd, tk.READABLE, self._on_inotify)
+                self._fd = fd
+            except (AttributeError, tk.TclError):
+                os.close(fd)
+        if signature is not None:
+            self._schedule(0)
+        else:
+            self._schedule(WATCH_INOTIFY_POLL_MS if self._fd is not None else self.interval)
+
+    def active(self):
+        return self._job is not None
+
+    def stop(self):
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+        if self._fd is not None:
+            self.root.tk.deletefilehandler(self._fd)
+            os.close(self._fd)
+            self._fd = None
+
+    def sync(self):
+        self.signature = self._stat()
+
+    def _stat(self):
+        signature = []
+        for path in self.paths:
+            try:
+                st = os.stat(path)
+                signature.append((st.st_size, st.st_mtime_ns))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _schedule(self, delay):
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+        self._job = self.root.after(delay, self.check)
+
+    def _on_inotify(self, fd, mask):
+        try:
+            while os.read(fd, 65536):
+                pass
+        except OSError:
+            pass
+        self._schedule(WATCH_DEBOUNCE_MS)
+
+    def check(self):
+        self._job = None
+        signature = self._stat()
+        if signature != self.signature and self.callback() is not False:
+            self.signature = signature
+        self._schedule(WATCH_INOTIFY_POLL_MS if self._fd is not None else self.interval)
+
+class AutoSaver:
+    def __init__(self, app, delay=AUTOSAVE_DELAY_MS):
+        self.app = app
+        self.root = app.root
+        self.delay = delay
+        self.enabled = True
+        self.timings = deque(maxlen=100)
+        self._job = None
+        self._poll_job = None
+        self._worker = None
+        self._rerun = False
+        self._results = queue.Queue()
+
+    def schedule(self):
+        if not self.enabled:
+            return
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+        self._job = self.root.after(self.delay, self._start)
+
+    def busy(self):
+        return self._worker is not None and self._worker.is_alive()
+
+    def saving(self):
+        return self.busy() or self._poll_job is not None
+
+    def _start(self):
+        self._job = None
+        self.app.bus.flush()
+        if self._job is not None or not self.app.can_autosave():
+            return
+        if self.busy():
+            self._rerun = True
+            return
+        started = time.perf_counter()
+        store = self.app.store
+        generation = self.app.edit_generation
+        data = store.snapshot(self.app.board)
+        snapshot_time = time.perf_counter() - started
+        self._worker = threading.Thread(target=self._write, args=(store, data, generation, snapshot_time), daemon=True)
+        self._worker.start()
+        self._poll()
+
+    def _write(self, store, data, generation, snapshot_time):
+        started = time.perf_counter()
+        try:
+            store.write(data)
+            error = None
+        except Exception as e:
+            error = e
+        self._results.put((store, generation, error, {
+            "snapshot": snapshot_time,
+            "write": time.perf_counter() - started,
+            "groups": len(data["changed"] if isinstance(data, dict) else data),
+        }))
+
+    def _poll(self):
+        self._poll_job = None
+        try:
+            store, generation, error, timing = self._results.get_nowait()
+        except queue.Empty:
+            self._poll_job = self.root.after(AUTOSAVE_POLL_MS, self._poll)
+            return
+        self._deliver(store, generation, error, timing)
+        if self._rerun:
+            self._rerun = False
+            self._start()
+
+    def _deliver(self, store, generation, error, timing):
+        self.timings.append(timing)
+        if error is not None:
+            self.app.autosave_failed(error)
+        else:
+            self.app.autosave_done(store, generation)
+
+    def wait(self):
+        if self._worker is not None:
+            self._worker.join()
+
+    def finish(self):
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._rerun = False
+        self.wait()
+        while not self._results.empty():
+            self._deliver(*self._results.get_nowait())
+
+    def shutdown(self):
+        for job in (self._job, self._poll_job):
+            if job is not None:
+                self.root.after_cancel(job)
+        self._job = self._poll_job = None
+        self._rerun = False
+        self.wait()
+        while not self._results.empty():
+            self._results.get_nowait()
+
+class FlashTicker:
+    def __init__(self, root):
+        self.root = root
+        self.labels = set()
+        self.state = False
+        self.paused = False
+        self._job = None
+        root.bind("<Unmap>", self._on_unmap, add="+")
+        root.bind("<Map>", self._on_map, add="+")
+
+    def add(self, label):
+        if label in self.labels:
+            return
+        self.labels.add(label)
+        if not getattr(label, "_ticker_bound", False):
+            label.bind("<Destroy>", lambda e, l=label: self.labels.discard(l), add="+")
+            label._ticker_bound = True
+        self._paint(label)
+        self._schedule()
+
+    def discard(self, label):
+        self.labels.discard(label)
+        if not self.labels:
+            self._cancel()
+
+    def is_flashing(self, label):
+        return label in self.labels
+
+    def _paint(self, label):
+        if self.state:
+            label.configure(background="#ff4444", foreground="#ffffff")
+        else:
+            label.configure(background="#ffffff", foreground="#ff4444")
+
+    def _tick(self):
+        self._job = None
+        self.state = not self.state
+        for label in list(self.labels):
+            try:
+                self._paint(label)
+            except tk.TclError:
+                self.labels.discard(label)
+        self._schedule()
+
+    def _schedule(self):
+        if self._job is None and self.labels and not self.paused:
+            self._job = self.root.after(FLASH_INTERVAL, self._tick)
+
+    def _cancel(self):
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def _on_unmap(self, event):
+        if event.widget is self.root:
+            self.paused = True
+            self._cancel()
+
+    def _on_map(self, event):
+        if event.widget is self.root:
+            self.paused = False
+            self._schedule()
+
+def handler_name(func):
+    name = getattr(func, "__qualname__", None) or getattr(func, "__name__", None)
+    return name or type(func).__name__
+
+class LatencyHistogram:
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, seconds):
+        ms = seconds * 1000
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+
+    def percentile(self, fraction):
+        wanted = self.count * fraction
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= wanted and n:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max
+        return 0.0
+
+    def to_data(self):
+        return {
+            "count": self.count,
+            "total_ms": self.total,
+            "max_ms": self.max,
+            "buckets_ms": dict(zip([f"<={b}" for b in LATENCY_BUCKETS_MS] + ["more"], self.buckets)),
+        }
+
+class Instrumentation:
+    def __init__(self, root):
+        self.root = root
+        self.enabled = False
+        self.stats = {}
+        self.trace = deque(maxlen=TRACE_EVENTS)
+        self.pending_after = set()
+        self.start = time.perf_counter()
+        self.overlay = None
+        self._overlay_text = None
+        self._originals = None
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        misc = tk.Misc
+        self._originals = (misc._register, misc.after, misc.after_cancel)
+        register, after, after_cancel = self._originals
+        instrumentation = self
+
+        def _register(widget, func, subst=None, needcleanup=1):
+            if getattr(func, "__name__", "") != "callit":
+                func = instrumentation.wrap(func)
+            return register(widget, func, subst, needcleanup)
+
+        def after_(widget, ms, func=None, *args):
+            if func is None:
+                return after(widget, ms)
+            name = "after:" + handler_name(func)
+            job_id = None
+
+            def job(*job_args):
+                instrumentation.pending_after.discard(job_id)
+                return instrumentation.call(name, func, job_args)
+            job_id = after(widget, ms, job, *args)
+            instrumentation.pending_after.add(job_id)
+            return job_id
+
+        def after_cancel_(widget, id):
+            instrumentation.pending_after.discard(id)
+            return after_cancel(widget, id)
+
+        misc._register = _register
+        misc.after = after_
+        misc.after_cancel = after_cancel_
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        tk.Misc._register, tk.Misc.after, tk.Misc.after_cancel = self._originals
+        self._originals = None
+        self.pending_after.clear()
+
+    def wrap(self, func):
+        name = handler_name(func)
+        call = self.call
+
+        def wrapper(*args):
+            return call(name, func, args)
+        wrapper.__name__ = getattr(func, "__name__", "handler")
+        return wrapper
+
+    def call(self, name, func, args):
+        if not self.enabled:
+            return func(*args)
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = LatencyHistogram()
+            stats.add(elapsed)
+            self.trace.append((name, start, elapsed))
+
+    def widget_count(self):
+        count = 0
+        stack = [self.root]
+        while stack:
+            widget = stack.pop()
+            count += 1
+            stack.extend(widget.winfo_children())
+        return count
+
+    def summary(self, limit=25):
+        rows = sorted(self.stats.items(), key=lambda kv: kv[1].total, reverse=True)[:limit]
+        lines = [
+            f"after jobs pending: {len(self.pending_after)}   widgets alive: {self.widget_count()}",
+            "",
+            f"{'handler':<52} {'calls':>7} {'mean':>8} {'p95':>7} {'max':>8}",
+        ]
+        for name, stats in rows:
+            lines.append(
+                f"{name[-52:]:<52} {stats.count:>7} {stats.total / stats.count:>6.2f}ms "
+                f"{stats.percentile(0.95):>5.0f}ms {stats.max:>6.1f}ms"
+            )
+        return "\n".join(lines)
+
+    def toggle_overlay(self, event=None):
+        if self.overlay is not None:
+            self.overlay.destroy()
+            self.overlay = None
+            return
+        self.overlay = tk.Toplevel(self.root)
+        self.overlay.title("TaskBarn Performance")
+        self.overlay.attributes("-topmost", True)
+        self.overlay.protocol("WM_DELETE_WINDOW", self.toggle_overlay)
+        self._overlay_text = tk.Text(self.overlay, width=90, height=32, font=("Courier", 9))
+        self._overlay_text.pack(fill="both", expand=True)
+        self._refresh_overlay()
+
+    def _refresh_overlay(self):
+        if self.overlay is None or not self.overlay.winfo_exists():
+            self.overlay = None
+            return
+        self._overlay_text.delete("1.0", "end")
+        self._overlay_text.insert("1.0", self.summary())
+        after = self._originals[1] if self._originals else tk.Misc.after
+        after(self.overlay, OVERLAY_REFRESH_MS, self._refresh_overlay)
+
+    def dump_trace(self, path=TRACE_FILE):
+        events = [
+            {"name": name, "ph": "X", "ts": (start - self.start) * 1e6, "dur": elapsed * 1e6, "pid": 1, "tid": 1}
+            for name, start, elapsed in self.trace
+        ]
+        data = {
+            "traceEvents": events,
+            "handlers": {name: stats.to_data() for name, stats in self.stats.items()},
+            "pending_after": len(self.pending_after),
+            "widgets": self.widget_count(),
+        }
+        with open(path, "w") as f:
+            json.dump(data, f)
+        return path
+
+class LayoutScheduler:
+    def __init__(self, root):
+        self.root = root
+        self.pending = {}
+        self.suspended = 0
+        self.flushes = 0
+        self._job = None
+
+    def request(self, key, callback):
+        self.pending[key] = callback
+        if self._job is None and not self.suspended:
+            self._job = self.root.after_idle(self.flush)
+
+    def discard(self, key):
+        self.pending.pop(key, None)
+
+    def flush(self):
+        self._job = None
+        if self.suspended:
+            return
+        self.flushes += 1
+        while self.pending:
+            pending = self.pending
+            self.pending = {}
+            for callback in pending.values():
+                try:
+                    callback()
+                except tk.TclError:
+                    pass
+
+    def suspend(self):
+        self.suspended += 1
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def resume(self):
+        self.suspended = max(0, self.suspended - 1)
+        if not self.suspended and self.pending:
+            self.flush()
+
+    @contextmanager
+    def bulk(self):
+        self.suspend()
+        try:
+            yield
+        finally:
+            self.resume()
+
+@lru_cache(maxsize=1024)
+def hex_rgb(color):
+    value = color.lstrip("#")
+    if len(value) == 3:
+        value = "".join(c * 2 for c in value)
+    try:
+        return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
+    except ValueError:
+        return 255, 255, 255
+
+@lru_cache(maxsize=1024)
+def contrast_color(color):
+    r, g, b = hex_rgb(color)
+    luminance = 0.299*r + 0.587*g + 0.114*b
+    return "#ffffff" if luminance < 128 else "#000000"
+
+@lru_cache(maxsize=1024)
+def shade_color(color, factor=0.9):
+    r, g, b = hex_rgb(color)
+    if contrast_color(color) == "#ffffff":
+        r, g, b = (min(255, int(c + (255 - c) * (1 - factor))) for c in (r, g, b))
+    else:
+        r, g, b = (int(c * factor) for c in (r, g, b))
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+class Theme:
+    def __init__(self, root, name="light"):
+        self.root = root
+        self.style = ttk.Style(root)
+        if "clam" in self.style.theme_names():
+            self.style.theme_use("clam")
+        self.name = None
+        self.colors = APP_THEMES["light"]
+        self.group_colors = {}
+        self.free_styles = []
+        self._next_style = 0
+        self.use(name)
+
+    def use(self, name):
+        if name not in APP_THEMES:
+            name = "light"
+        if name == self.name:
+            return False
+        self.name = name
+        c = self.colors = APP_THEMES[name]
+        s = self.style
+        s.configure("App.TFrame", background=c["bg"])
+        s.configure("App.TLabel", background=c["bg"], foreground=c["fg"])
+        s.configure("App.TButton", background=c["field"], foreground=c["fg"], bordercolor=c["border"])
+        s.map("App.TButton", background=[("pressed", shade_color(c["field"])), ("active", shade_color(c["field"]))])
+        s.configure("App.TMenubutton", background=c["field"], foreground=c["fg"], bordercolor=c["border"], arrowcolor=c["fg"])
+        s.map("App.TMenubutton", background=[("active", shade_color(c["field"]))])
+        s.configure("App.TEntry", fieldbackground=c["field"], foreground=c["fg"], insertcolor=c["fg"], bordercolor=c["border"])
+        s.configure("App.Vertical.TScrollbar", background=c["field"], troughcolor=c["bg"], bordercolor=c["border"], arrowcolor=c["fg"])
+        s.configure("App.TCheckbutton", background=c["bg"], foreground=c["fg"])
+        s.map("App.TCheckbutton", background=[("active", c["bg"])])
+        s.configure("App.Toolbutton", background=c["bg"], foreground=c["fg"], padding=(8, 2))
+        s.map("App.Toolbutton", background=[("selected", c["field"]), ("active", shade_color(c["bg"]))])
+        return True
+
+    def group_style(self):
+        if self.free_styles:
+            return self.free_styles.pop()
+        self._next_style += 1
+        return f"G{self._next_style}"
+
+    def release_group_style(self, prefix):
+        if prefix in self.group_colors:
+            self.free_styles.append(prefix)
+
+    def color_group(self, prefix, color):
+        if self.group_colors.get(prefix) == color:
+            return False
+        self.group_colors[prefix] = color
+        fg = contrast_color(color)
+        active = shade_color(color)
+        s = self.style
+        s.configure(prefix + ".TFrame", background=color, bordercolor="#bbbbbb")
+        s.configure(prefix + ".TLabel", background=color, foreground=fg)
+        s.configure(prefix + ".TButton", background=color, foreground=fg, padding=1)
+        s.map(prefix + ".TButton", background=[("pressed", active), ("active", active)])
+        s.configure(prefix + ".TCheckbutton", background=color, foreground=fg)
+        s.map(prefix + ".TCheckbutton", background=[("active", color)])
+        s.configure(prefix + ".TLabelframe", background=color, bordercolor="#bbbbbb")
+        s.configure(prefix + ".TLabelframe.Label", background=color, foreground=fg)
+        s.configure(prefix + ".TEntry", fieldbackground=color, foreground=fg, insertcolor=fg)
+        return True
+
+class ItemRow:
+    __slots__ = ("item", "container", "text", "var", "deadline_label", "prev", "next")
+
+    def __init__(self, item, container=None, text=None, var=None, deadline_label=None):
+        self.item = item
+        self.container = container
+        self.text = text
+        self.var = var
+        self.deadline_label = deadline_label
+        self.prev = None
+        self.next = None
+
+class RowList:
+    def __init__(self):
+        self.rows = {}
+        self.first = None
+        self.last = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        row = self.first
+        while row is not None:
+            yield row
+            row = row.next
+
+    def get(self, item_id):
+        return self.rows.get(item_id)
+
+    def append(self, row):
+        row.prev = self.last
+        row.next = None
+        if self.last is not None:
+            self.last.next = row
+        else:
+            self.first = row
+        self.last = row
+        self.rows[row.item.id] = row
+        return row
+
+    def insert(self, row, before=None):
+        if before is None:
+            return self.append(row)
+        row.prev = before.prev
+        row.next = before
+        if before.prev is not None:
+            before.prev.next = row
+        else:
+            self.first = row
+        before.prev = row
+        self.rows[row.item.id] = row
+        return row
+
+    def remove(self, item_id):
+        row = self.rows.pop(item_id, None)
+        if row is None:
+            return None
+        if row.prev is not None:
+            row.prev.next = row.next
+        else:
+            self.first = row.next
+        if row.next is not None:
+            row.next.prev = row.prev
+        else:
+            self.last = row.prev
+        return row
+
+class Task:
+    def __init__(self, root, group, board, theme, ticker, layout_scheduler, remove_callback=None, resize_callback=None, item_filter=None, focus_callback=None):
+        self.group = group
+        self.board = board
+        self.theme = theme
+        self.ticker = ticker
+        self.layout_scheduler = layout_scheduler
+        self.item_filter = item_filter
+        self.remove_callback = remove_callback
+        self.resize_callback = resize_callback
+        self.focus_callback = focus_callback
+        self.checkboxes = RowList()
+        self._rows_limit = 0
+        self._expand_job = None
+
+        self.style = self.theme.group_style()
+        self.theme.color_group(self.style, self.color)
+        frame_style = self.style + ".TFrame"
+        label_style = self.style + ".TLabel"
+        button_style = self.style + ".TButton"
+
+        self.container = ttk.Frame(root, style=frame_style, relief="solid", borderwidth=1)
+        self.container.bind("<Destroy>", self._on_destroy)
         self.container.grid_propagate(False)
-        self.top_frame = tk.Frame(self.container, height=50, bg=self.color)
+        self.top_frame = ttk.Frame(self.container, height=50, style=frame_style)
         self.top_frame.pack(fill="x")
-        self.emoji_label = tk.Label(self.top_frame, text="", font=("Segoe UI Emoji", 36), bg=self.color)
+        self.emoji_label = ttk.Label(self.top_frame, text="", font=("Segoe UI Emoji", 36), style=label_style)
         self.emoji_label.pack(side="left", anchor="w")
         self.trash_armed = False
         self.remove_task_label = tk.Label(
@@ -45,6 +2239,7 @@ class Task:
             relief="solid",
             borderwidth=1,
             bg="#ffcccc",
+            fg="#000000",
             cursor="hand2"
         )
         self.remove_task_label.pack(side="right", padx=10, pady=(5, 10))
@@ -53,51 +2248,163 @@ class Task:
         self.remove_task_label.bind("<FocusOut>", self.reset_trash)
         self.remove_task_label.bind("<Double-Button-1>", self.trash_click)
         
-        self.color_btn = tk.Button(self.top_frame, text="🎨", width=2, command=self.pick_color, bg=self.color)
+        self.color_btn = ttk.Button(self.top_frame, text="🎨", width=2, command=self.pick_color, style=button_style)
         self.color_btn.pack(side="right", padx=5)
 
-        self.due_btn = tk.Button(self.top_frame, text="📅", width=2, command=self.set_due_date, bg=self.color)
+        self.due_btn = ttk.Button(self.top_frame, text="📅", width=2, command=self.set_due_date, style=button_style)
         self.due_btn.pack(side="right", padx=5)
-        self.due_label = tk.Label(self.top_frame, font=("Segoe UI", 9), bg=self.color)
+        self.due_label = ttk.Label(self.top_frame, font=("Segoe UI", 9), style=label_style)
         self.due_label.pack(side="right", padx=5)
         self.due_label.config(text=self.get_due_text())
         
-        self.title_frame = tk.Frame(self.container, bg=self.color)
+        self.title_frame = ttk.Frame(self.container, style=frame_style)
         self.title_frame.pack(fill="x", pady=(0, 5))
+
+        self.collapse_btn = ttk.Button(self.title_frame, text="▾", width=2, command=self.toggle_collapsed, style=button_style)
+        self.collapse_btn.pack(side="left", padx=(5, 0))
+        self.count_label = ttk.Label(self.title_frame, font=("Segoe UI", 8), style=label_style)
+        self.count_label.pack(side="right", padx=5)
         
-        self.title_label = tk.Label(self.title_frame, text=title, font=("Segoe UI", 10, "bold"), bg=self.color)
+        self.title_label = ttk.Label(self.title_frame, text=self.title, font=("Segoe UI", 10, "bold"), anchor="center", style=label_style)
         self.title_label.pack(side="left", fill="x", expand=True)
         self.title_label.bind("<Double-Button-1>", self.start_title_edit)
         
-        self.title_entry = tk.Entry(self.title_frame, font=("Segoe UI", 10), bg=self.color)
+        self.title_entry = ttk.Entry(self.title_frame, font=("Segoe UI", 10), style=self.style + ".TEntry")
         self.title_entry.bind("<Return>", self.finish_title_edit)
         self.title_entry.bind("<Escape>", self.cancel_title_edit)
         self.title_entry.bind("<FocusOut>", self.finish_title_edit)
-        self.title_entry.bind("<KeyRelease>", self._on_title_edit)
 
-        self.frame = tk.LabelFrame(self.container, text="", bg=self.color, padx=10, pady=10)
-        self.frame.pack(fill="x", pady=(5, 0))
+        self.frame = ttk.LabelFrame(self.container, text="", padding=10, style=self.style + ".TLabelframe")
 
-        self.add_button = tk.Button(self.frame, text="+ Add Task", command=self.add_checkbox, bg=self.color)
+        self.add_button = ttk.Button(self.frame, text="+ Add Task", command=self.add_checkbox, style=button_style)
         self.add_button.pack(anchor="w", pady=5)
+        self.more_button = ttk.Button(self.frame, command=self.show_more_items, style=button_style)
 
-        if checkboxes:
-            for cb_data in checkboxes:
-                if len(cb_data) == 2:
-                    label, checked = cb_data
-                    deadline = ""
-                elif len(cb_data) > 2:
-                    label, checked, deadline = cb_data[:3]
-                else:
-                    print(f"Skipping invalid checkbox data during init: {cb_data}")
-                    continue 
-                self.add_checkbox(label, checked, deadline)
-        else:
-            self.add_checkbox()
+        self._show_items()
+        self.update_emoji()
+        self.update_counts()
+        self.apply_color()
+
+    def _on_destroy(self, event):
+        if event.widget is self.container:
+            self.theme.release_group_style(self.style)
+
+    @property
+    def title(self):
+        return self.group.title
+
+    @property
+    def due_date(self):
+        return self.group.due_date
+
+    @property
+    def color(self):
+        return self.group.color
+
+    @property
+    def created(self):
+        return self.group.created
 
+    def bind_group(self, group):
+        self.release()
+        self._clear_item_rows()
+        self.group = group
+        self.cancel_title_edit()
+        self.title_label.config(text=group.title)
+        self._show_items()
         self.update_emoji()
+        self.update_counts()
         self.apply_color()
 
+    def release(self):
+        self.reset_trash()
+        self.stop_due_flash()
+        self._cancel_expand()
+        for deadline_label in self._deadline_labels():
+            self.stop_checkbox_due_flash(deadline_label)
+
+    def _deadline_labels(self):
+        return [row.deadline_label for row in self.checkboxes]
+
+    def toggle_collapsed(self):
+        self.board.set_collapsed(self.group, not self.group.collapsed)
+        if self.group.collapsed:
+            self._clear_item_rows()
+        self._show_items()
+
+    def _show_items(self):
+        if self.group.collapsed:
+            self.collapse_btn.config(text="▸")
+            self.frame.pack_forget()
+            self._notify_resize()
+            return
+        self.collapse_btn.config(text="▾")
+        self.frame.pack(fill="x", pady=(5, 0))
+        self._rows_limit = max(self._rows_limit, min(self.visible_count(), ITEM_PAGE_SIZE))
+        self._build_item_batch()
+
+    def visible_items(self):
+        if self.item_filter is None:
+            return self.group.items
+        return [item for item in self.group.items if item.id in self.item_filter]
+
+    def visible_count(self):
+        if self.item_filter is None:
+            return self.group.item_count()
+        return len(self.visible_items())
+
+    def set_item_filter(self, item_filter):
+        if item_filter == self.item_filter:
+            return
+        self.item_filter = item_filter
+        self._clear_item_rows()
+        self._show_items()
+
+    def _build_item_batch(self):
+        self._expand_job = None
+        items = self.visible_items()
+        start = len(self.checkboxes)
+        end = min(start + ITEM_BATCH_SIZE, self._rows_limit, len(items))
+        for item in items[start:end]:
+            self._add_item_row(item)
+        if end < min(self._rows_limit, len(items)):
+            self._expand_job = self.container.after(1, self._build_item_batch)
+        self._update_more_button()
+        self._notify_resize()
+
+    def _cancel_expand(self):
+        if self._expand_job is not None:
+            self.container.after_cancel(self._expand_job)
+            self._expand_job = None
+
+    def _clear_item_rows(self):
+        self._cancel_expand()
+        for row in self.checkboxes:
+            self.stop_checkbox_due_flash(row.deadline_label)
+            row.container.destroy()
+        self.checkboxes = RowList()
+        self._rows_limit = 0
+        self.more_button.pack_forget()
+
+    def show_more_items(self, count=ITEM_PAGE_SIZE):
+        self._rows_limit = len(self.checkboxes) + count
+        if self._expand_job is None:
+            self._build_item_batch()
+
+    def _update_more_button(self):
+        remaining = self.visible_count() - len(self.checkboxes)
+        self.more_button.pack_forget()
+        if remaining > 0 and self._expand_job is None:
+            self.more_button.config(text=f"Show more ({remaining} hidden)")
+            self.more_button.pack(anchor="w", pady=5)
+
+    def _notify_resize(self):
+        if self.resize_callback:
+            self.resize_callback()
+
+    def update_counts(self):
+        self.count_label.config(text=f"{self.group.done_count()}/{self.group.item_count()} done")
+
     def start_title_edit(self, event=None):
         self.title_label.pack_forget()
         self.title_entry.delete(0, tk.END)
@@ -109,10 +2416,8 @@ class Task:
     def finish_title_edit(self, event=None):
         new_title = self.title_entry.get().strip()
         if new_title and new_title != self.title:
-            self.title = new_title
+            self.board.set_title(self.group, new_title)
             self.title_label.config(text=new_title)
-            if self.dirty_callback:
-                self.dirty_callback()
         self.title_entry.pack_forget()
         self.title_label.pack(side="left", fill="x", expand=True)
 
@@ -120,26 +2425,44 @@ class Task:
         self.title_entry.pack_forget()
         self.title_label.pack(side="left", fill="x", expand=True)
 
-    def _on_title_edit(self, event=None):
-        if self.dirty_callback:
-            self.dirty_callback()
-
     def add_checkbox(self, label="", checked=False, deadline=None):
+        item = self.board.add_item(self.group, label, checked, deadline)
+        if self.item_filter is not None:
+            self.item_filter.add(item.id)
+        if len(self.checkboxes) == self.visible_count() - 1:
+            self._add_item_row(item)
+            self._rows_limit = max(self._rows_limit, len(self.checkboxes))
+            self._update_more_button()
+            self._notify_resize()
+        else:
+            self.show_more_items(len(self.group.items))
+        self.update_emoji()
+        self.update_counts()
+
+    def _add_item_row(self, item, before=None):
+        checked = item.checked
+        deadline = item.deadline
         var = tk.BooleanVar(value=checked)
-        container = tk.Frame(self.frame, bg=self.color)
-        container.pack(fill="x", pady=2)
+        frame_style = self.style + ".TFrame"
+        button_style = self.style + ".TButton"
+        text_color = self.get_text_color()
+        container = ttk.Frame(self.frame, style=frame_style)
+        if before is not None:
+            container.pack(fill="x", pady=2, before=before.container)
+        else:
+            container.pack(fill="x", pady=2)
 
-        checkbox_frame = tk.Frame(container, bg=self.color)
+        checkbox_frame = ttk.Frame(container, style=frame_style)
         checkbox_frame.pack(fill="x")
         
-        cb = tk.Checkbutton(checkbox_frame, variable=var, command=lambda e=None, v=var: self.toggle_entry_color(text_widget, v), bg=self.color, fg=self.get_text_color(), selectcolor=self.color, activebackground=self.color, activeforeground=self.get_text_color())
+        cb = ttk.Checkbutton(checkbox_frame, variable=var, command=lambda: self._on_checkbox_toggle(item, text_widget, var), style=self.style + ".TCheckbutton")
         cb.pack(side="left")
         
-        text_frame = tk.Frame(checkbox_frame, bg=self.color)
+        text_frame = ttk.Frame(checkbox_frame, style=frame_style)
         text_frame.pack(side="left", fill="x", expand=True, padx=(5, 5))
         
-        text_widget = tk.Text(text_frame, height=1, width=30, wrap=tk.WORD, bg=self.color, fg=self.get_text_color())
-        text_widget.insert("1.0", label)
+        text_widget = tk.Text(text_frame, height=1, width=30, wrap=tk.WORD, bg=self.color, fg=text_color, insertbackground=text_color)
+        text_widget.insert("1.0", item.label)
         text_widget.pack(side="left", fill="x", expand=True)
         
         scrollbar = tk.Scrollbar(text_frame, orient="vertical", command=text_widget.yview)
@@ -148,93 +2471,121 @@ class Task:
         
         scrollbar.pack_forget()
         
-        def adjust_height(event=None):
-            text_widget.update_idletasks()
+        def fit_height():
             num_lines = int(text_widget.index('end-1c').split('.')[0])
-            text_widget.configure(height=min(num_lines, 3))
+            if int(text_widget.cget("height")) != min(num_lines, 3):
+                text_widget.configure(height=min(num_lines, 3))
+                self._notify_resize()
             
             if num_lines > 3:
                 scrollbar.pack(side="right", fill="y")
             else:
                 scrollbar.pack_forget()
+
+        def adjust_height(event=None):
+            self.layout_scheduler.request(text_widget, fit_height)
         
-        text_widget.bind("<Tab>", lambda e, text=text_widget: self.focus_next_entry(text))
-        text_widget.bind("<Shift-Tab>", lambda e, text=text_widget: self.focus_prev_entry(text))
-        text_widget.bind("<KeyRelease>", lambda e: (self._on_checkbox_edit(e), adjust_height()))
+        text_widget.bind("<Tab>", lambda e: self.focus_next_entry(item.id))
+        text_widget.bind("<Shift-Tab>", lambda e: self.focus_prev_entry(item.id))
+        text_widget.bind("<KeyRelease>", lambda e: (self._on_checkbox_edit(item, text_widget), adjust_height()))
         text_widget.bind("<Configure>", adjust_height)
         
         text_widget.tag_configure("strikethrough", overstrike=1)
         text_widget.tag_configure("normal", overstrike=0)
 
-        bottom_frame = tk.Frame(container, bg=self.color)
+        bottom_frame = ttk.Frame(container, style=frame_style)
         bottom_frame.pack(fill="x", padx=(25, 0))
 
-        deadline_btn = tk.Button(bottom_frame, text="📅", width=2, command=lambda: self.set_checkbox_deadline(container, deadline_label), bg=self.color, fg=self.get_text_color())
+        deadline_btn = ttk.Button(bottom_frame, text="📅", width=2, command=lambda: self.set_checkbox_deadline(item, deadline_label), style=button_style)
         deadline_btn.pack(side="left", padx=2)
         
-        deadline_label = tk.Label(bottom_frame, text="", font=("Segoe UI", 8), bg=self.color, fg=self.get_text_color())
+        deadline_label = ttk.Label(bottom_frame, text="", font=("Segoe UI", 8), style=self.style + ".TLabel")
         deadline_label.pack(side="left", padx=2)
         
-        deadline_label._flashing = False
-        deadline_label._flash_id = None
-
         if deadline:
-            self.get_checkbox_due_text(deadline_label, deadline)
+            self.get_checkbox_due_text(deadline_label, item)
 
-        close = tk.Button(checkbox_frame, text="✖", width=3, command=lambda: self.remove_checkbox(container, text_widget, var), bg=self.color, fg=self.get_text_color())
+        close = ttk.Button(checkbox_frame, text="✖", width=3, command=lambda: self.remove_checkbox(item.id), style=button_style)
         close.pack(side="right")
 
-        self.checkboxes.append((container, text_widget, var, cb, deadline_label, deadline or ""))
+        self.checkboxes.insert(ItemRow(item, container, text_widget, var, deadline_label), before)
 
         self.toggle_entry_color(text_widget, var)
-        if checked:
-            text_widget.after(1, lambda: text_widget.configure(foreground="#808080"))
         
         adjust_height()
 
-        self.update_emoji()
-        if self.dirty_callback:
-            self.dirty_callback()
-
     def get_text_color(self):
-        bg = self.color.lstrip('#')
-        if len(bg) == 3:
-            bg = ''.join([c*2 for c in bg])
-        r, g, b = int(bg[0:2], 16), int(bg[2:4], 16), int(bg[4:6], 16)
-        luminance = 0.299*r + 0.587*g + 0.114*b
-        return '#ffffff' if luminance < 128 else '#000000'
-
-    def remove_checkbox(self, container, text_widget, var):
-        for cb_data in self.checkboxes:
-            if cb_data[0] == container:
-                deadline_label = cb_data[4]
-                self.stop_checkbox_due_flash(deadline_label)
-                break
+        return contrast_color(self.color)
+
+    def remove_checkbox(self, item_id):
+        row = self.checkboxes.get(item_id)
+        if row is None:
+            return
+        self.board.remove_item(self.group, row.item)
+        self.item_removed(row.item)
 
-        container.destroy()
-        self.checkboxes = [cb for cb in self.checkboxes if cb[0] != container]
+    def item_inserted(self, item):
+        items = self.visible_items()
+        if item in items and not self.group.collapsed:
+            position = items.index(item)
+            shown = len(self.checkboxes)
+            if position < shown or shown == len(items) - 1:
+                following = items[position + 1] if position + 1 < len(items) else None
+                self._add_item_row(item, self.checkboxes.get(following.id) if following is not None else None)
+                self._rows_limit = max(self._rows_limit, len(self.checkboxes))
+        self._update_more_button()
+        self._notify_resize()
         self.update_emoji()
-        if self.dirty_callback:
-            self.dirty_callback()
+        self.update_counts()
 
-    def _on_checkbox_edit(self, event=None):
-        if self.dirty_callback:
-            self.dirty_callback()
+    def item_removed(self, item):
+        row = self.checkboxes.get(item.id)
+        if row is not None:
+            self._remove_item_row(row)
+        self._update_more_button()
+        self._notify_resize()
+        self.update_emoji()
+        self.update_counts()
+
+    def _remove_item_row(self, row):
+        self.checkboxes.remove(row.item.id)
+        self.stop_checkbox_due_flash(row.deadline_label)
+        row.container.destroy()
+
+    def refresh_item(self, item):
+        row = self.checkboxes.get(item.id)
+        if row is None:
+            return
+        if row.text.get("1.0", "end-1c") != item.label:
+            row.text.delete("1.0", "end")
+            row.text.insert("1.0", item.label)
+        row.var.set(item.checked)
+        self.toggle_entry_color(row.text, row.var)
+        self.get_checkbox_due_text(row.deadline_label, item)
+        self.update_counts()
+
+    def _on_checkbox_edit(self, item, text_widget):
+        label = text_widget.get("1.0", "end-1c")
+        if label != item.label:
+            self.board.set_item_text(self.group, item, label)
+
+    def _on_checkbox_toggle(self, item, text_widget, var):
+        self.board.set_item_checked(self.group, item, var.get())
+        self.toggle_entry_color(text_widget, var)
+        self.update_counts()
 
     def toggle_entry_color(self, text_widget, var):
         if var.get():
-            text_widget.configure(foreground="#808080")
+            text_widget.configure(foreground=CHECKED_TEXT_COLOR)
             text_widget.tag_remove("normal", "1.0", "end-1c")
             text_widget.tag_add("strikethrough", "1.0", "end-1c")
         else:
             text_widget.configure(foreground=self.get_text_color())
             text_widget.tag_remove("strikethrough", "1.0", "end-1c")
             text_widget.tag_add("normal", "1.0", "end-1c")
-        if self.dirty_callback:
-            self.dirty_callback()
 
     def update_emoji(self):
-        count = len(self.checkboxes)
+        count = self.group.item_count()
         if count == 0:
             emoji = "🥚"
         elif count <= 3:
@@ -250,7 +2601,8 @@ class Task:
         self.emoji_label.config(text=emoji)
 
     def remove_task(self):
-        for _, _, _, _, deadline_label, _ in self.checkboxes:
+        self._cancel_expand()
+        for deadline_label in self._deadline_labels():
              self.stop_checkbox_due_flash(deadline_label)
 
         self.container.destroy()
@@ -258,77 +2610,62 @@ class Task:
             self.remove_callback(self)
 
     def get_data(self):
-        return {
-            "title": self.title,
-            "checkboxes": [(text_widget.get("1.0", "end-1c"), var.get(), deadline) for _, text_widget, var, _, _, deadline in self.checkboxes],
-            "due_date": self.due_date,
-            "color": self.color,
-            "created": self.created
-        }
+        return self.group.to_data()
 
-    def focus_next_entry(self, current_text):
-        entries = [text for _, text, _ in self.checkboxes]
-        try:
-            idx = entries.index(current_text)
-            if idx + 1 < len(entries):
-                entries[idx + 1].focus_set()
-                return "break"
-        except ValueError:
-            pass
+    def focus_next_entry(self, item_id):
+        row = self.checkboxes.get(item_id)
+        if row is None:
+            return "break"
+        if row.next is None and self.visible_count() > len(self.checkboxes):
+            self.show_more_items()
+        if row.next is not None:
+            self._focus_row(row.next)
+        elif self.focus_callback:
+            self.focus_callback(self, 1)
+        return "break"
 
-    def focus_prev_entry(self, current_text):
-        entries = [text for _, text, _ in self.checkboxes]
-        try:
-            idx = entries.index(current_text)
-            if idx > 0:
-                entries[idx - 1].focus_set()
-                return "break"
-        except ValueError:
-            pass
+    def focus_prev_entry(self, item_id):
+        row = self.checkboxes.get(item_id)
+        if row is None:
+            return "break"
+        if row.prev is not None:
+            self._focus_row(row.prev)
+        elif self.focus_callback:
+            self.focus_callback(self, -1)
+        return "break"
+
+    def focus_edge(self, first=True):
+        if self.group.collapsed:
+            return False
+        row = self.checkboxes.first if first else self.checkboxes.last
+        if row is None:
+            return False
+        self._focus_row(row)
+        return True
+
+    def _focus_row(self, row):
+        row.text.focus_set()
 
     def pick_color(self):
+        from tkinter import colorchooser
         color_code = colorchooser.askcolor(title="Choose task color", initialcolor=self.color)[1]
         if color_code:
-            self.color = color_code
-            self.apply_color()
-            if self.dirty_callback:
-                self.dirty_callback()
+            self.board.set_color(self.group, color_code)
+            with self.layout_scheduler.bulk():
+                self.apply_color()
 
     def apply_color(self):
-        text_color = self.get_text_color()
-        widgets = [self.container, self.top_frame, self.title_frame, self.frame, self.emoji_label, self.due_label, self.title_label, self.title_entry, self.add_button, self.color_btn, self.due_btn]
-        for w in widgets:
-            try:
-                w.configure(bg=self.color)
-            except Exception:
-                pass
-            try:
-                w.configure(fg=text_color)
-            except Exception:
-                pass
-        for container, text_widget, var, cb, deadline_label, deadline in self.checkboxes:
-            try:
-                container.configure(bg=self.color)
-                text_widget.configure(bg=self.color, fg=text_color)
-                cb.configure(bg=self.color, fg=text_color, selectcolor=self.color, activebackground=self.color, activeforeground=text_color)
-                current_text = deadline_label.cget('text')
-                is_overdue_text = "days overdue" in current_text
-
-                if not getattr(deadline_label, '_flashing', False) or not is_overdue_text:
-                     deadline_label.configure(bg=self.color, fg=text_color)
-
-                for child in container.winfo_children():
-                    if isinstance(child, tk.Button):
-                        child.configure(bg=self.color, fg=text_color)
-            except Exception:
-                pass
-        try:
-            self.remove_task_label.configure(fg="#000000")
-        except Exception:
-            pass
+        if self.theme.color_group(self.style, self.color):
+            text_color = self.get_text_color()
+            for row in self.checkboxes:
+                row.text.configure(
+                    bg=self.color, insertbackground=text_color,
+                    fg=CHECKED_TEXT_COLOR if row.var.get() else text_color
+                )
         self.due_label.config(text=self.get_due_text())
 
     def set_due_date(self):
+        Calendar = load_calendar()
         if Calendar is None:
             messagebox.showerror("Calendar Not Installed", "Please install tkcalendar: pip install tkcalendar")
             return
@@ -338,17 +2675,13 @@ class Task:
         cal.pack(padx=10, pady=10)
         
         def set_date():
-            self.due_date = cal.get_date()
+            self.board.set_due_date(self.group, cal.get_date())
             self.due_label.config(text=self.get_due_text())
-            if self.dirty_callback:
-                self.dirty_callback()
             top.destroy()
             
         def remove_date():
-            self.due_date = ""
+            self.board.set_due_date(self.group, "")
             self.due_label.config(text="")
-            if self.dirty_callback:
-                self.dirty_callback()
             top.destroy()
             
         btn_frame = tk.Frame(top)
@@ -363,50 +2696,32 @@ class Task:
         if not self.due_date:
             self.stop_due_flash()
             return ""
-        try:
-            due = datetime.strptime(self.due_date, "%m/%d/%y").date()
-            today = datetime.now().date()
-            days_left = (due - today).days
-            if days_left == 0:
-                self.start_due_flash()
-                return f"{self.due_date} (Due today!)"
-            elif days_left == 1:
-                self.start_due_flash()
-                return f"{self.due_date} (Due tomorrow!)"
-            elif days_left < 0:
-                self.stop_due_flash(overdue=True)
-                return f"{self.due_date} ({-days_left} days overdue)"
-            else:
-                self.stop_due_flash()
-                return f"{self.due_date} ({days_left} days left)"
-        except Exception:
+        if self.group.due_ord is None:
             self.stop_due_flash()
             return self.due_date
+        days_left = days_until(self.group.due_ord)
+        if days_left == 0:
+            self.start_due_flash()
+            return f"{self.due_date} (Due today!)"
+        elif days_left == 1:
+            self.start_due_flash()
+            return f"{self.due_date} (Due tomorrow!)"
+        elif days_left < 0:
+            self.stop_due_flash(overdue=True)
+            return f"{self.due_date} ({-days_left} days overdue)"
+        else:
+            self.stop_due_flash()
+            return f"{self.due_date} ({days_left} days left)"
 
     def start_due_flash(self):
-        if hasattr(self, '_flashing') and self._flashing:
-            return
-        self._flashing = True
-        self._flash_state = False
-        self._flash_due_label()
+        self.ticker.add(self.due_label)
 
     def stop_due_flash(self, overdue=False):
-        if hasattr(self, '_flashing') and self._flashing:
-            self._flashing = False
+        self.ticker.discard(self.due_label)
         if overdue:
-            self.due_label.configure(bg="#000000", fg="#ffffff")
-        else:
-            self.due_label.configure(bg=self.color, fg=self.get_text_color())
-
-    def _flash_due_label(self):
-        if not getattr(self, '_flashing', False):
-            return
-        if self._flash_state:
-            self.due_label.configure(bg="#ff4444", fg="#ffffff")
+            self.due_label.configure(background="#000000", foreground="#ffffff")
         else:
-            self.due_label.configure(bg="#ffffff", fg="#ff4444")
-        self._flash_state = not self._flash_state
-        self.due_label.after(400, self._flash_due_label)
+            self.due_label.configure(background="", foreground="")
 
     def trash_click(self, event=None):
         if not self.trash_armed:
@@ -420,19 +2735,11 @@ class Task:
             self.trash_armed = False
             self.remove_task_label.configure(bg="#ffcccc")
 
-    def set_checkbox_deadline(self, container, deadline_label):
+    def set_checkbox_deadline(self, item, deadline_label):
+        Calendar = load_calendar()
         if Calendar is None:
             messagebox.showerror("Calendar Not Installed", "Please install tkcalendar: pip install tkcalendar")
             return
-        
-        checkbox_data = None
-        for cb_data in self.checkboxes:
-            if cb_data[0] == container:
-                checkbox_data = cb_data
-                break
-        
-        if not checkbox_data:
-            return
             
         top = tk.Toplevel()
         top.title("Select Deadline")
@@ -440,20 +2747,13 @@ class Task:
         cal.pack(padx=10, pady=10)
         
         def set_date():
-            date = cal.get_date()
-            idx = self.checkboxes.index(checkbox_data)
-            self.checkboxes[idx] = (container, checkbox_data[1], checkbox_data[2], checkbox_data[3], deadline_label, date)
-            self.get_checkbox_due_text(deadline_label, date)
-            if self.dirty_callback:
-                self.dirty_callback()
+            self.board.set_item_deadline(self.group, item, cal.get_date())
+            self.get_checkbox_due_text(deadline_label, item)
             top.destroy()
             
         def remove_date():
-            idx = self.checkboxes.index(checkbox_data)
-            self.checkboxes[idx] = (container, checkbox_data[1], checkbox_data[2], checkbox_data[3], deadline_label, "")
-            self.get_checkbox_due_text(deadline_label, "")
-            if self.dirty_callback:
-                self.dirty_callback()
+            self.board.set_item_deadline(self.group, item, "")
+            self.get_checkbox_due_text(deadline_label, item)
             top.destroy()
             
         btn_frame = tk.Frame(top)
@@ -464,34 +2764,31 @@ class Task:
         top.grab_set()
         top.wait_window()
 
-    def get_checkbox_due_text(self, deadline_label, due_date):
+    def get_checkbox_due_text(self, deadline_label, item):
         text_to_display = ""
         should_flash = False
         is_overdue = False
+        due_date = item.deadline
 
         if not due_date:
             self.stop_checkbox_due_flash(deadline_label)
             text_to_display = ""
+        elif item.deadline_ord is None:
+            text_to_display = due_date
         else:
-            try:
-                due = datetime.strptime(due_date, "%m/%d/%y").date()
-                today = datetime.now().date()
-                days_left = (due - today).days
-
-                if days_left == 0:
-                    text_to_display = f"{due_date} (Today!)"
-                    should_flash = True
-                elif days_left == 1:
-                    text_to_display = f"{due_date} (Tomorrow!)"
-                    should_flash = True
-                elif days_left < 0:
-                    text_to_display = f"{due_date} ({-days_left} days overdue)"
-                    is_overdue = True
-                else:
-                    text_to_display = f"{due_date} ({days_left} days left)"
+            days_left = days_until(item.deadline_ord)
 
-            except Exception:
-                text_to_display = due_date 
+            if days_left == 0:
+                text_to_display = f"{due_date} (Today!)"
+                should_flash = True
+            elif days_left == 1:
+                text_to_display = f"{due_date} (Tomorrow!)"
+                should_flash = True
+            elif days_left < 0:
+                text_to_display = f"{due_date} ({-days_left} days overdue)"
+                is_overdue = True
+            else:
+                text_to_display = f"{due_date} ({days_left} days left)"
 
         deadline_label.config(text=text_to_display)
 
@@ -505,67 +2802,700 @@ class Task:
         return text_to_display
 
     def start_checkbox_due_flash(self, deadline_label):
-        if getattr(deadline_label, '_flashing', False):
-            return
-        deadline_label._flashing = True
-        deadline_label._flash_state = False
-        self._flash_single_checkbox_due_label(deadline_label)
+        self.ticker.add(deadline_label)
 
     def stop_checkbox_due_flash(self, deadline_label, overdue=False):
-        if getattr(deadline_label, '_flashing', False):
-            deadline_label._flashing = False
-            if hasattr(deadline_label, '_flash_id') and deadline_label._flash_id:
-                 try:
-                    deadline_label.after_cancel(deadline_label._flash_id)
-                 except tk.TclError:
-                    pass
-                 deadline_label._flash_id = None
-
+        self.ticker.discard(deadline_label)
         if overdue:
-            deadline_label.configure(bg="#000000", fg="#ffffff")
+            deadline_label.configure(background="#000000", foreground="#ffffff")
         else:
-            deadline_label.configure(bg=self.color, fg=self.get_text_color())
+            deadline_label.configure(background="", foreground="")
 
-    def _flash_single_checkbox_due_label(self, deadline_label):
-        if not getattr(deadline_label, '_flashing', False) or not deadline_label.winfo_exists():
-            if hasattr(deadline_label, '_flash_id') and deadline_label._flash_id:
-                 try:
-                    deadline_label.after_cancel(deadline_label._flash_id)
-                 except tk.TclError:
-                    pass
-                 deadline_label._flash_id = None
+class TagLabel:
+    __slots__ = ("widget", "tag", "value", "on_text", "_ticker_bound")
+
+    def __init__(self, widget, tag, on_text=None):
+        self.widget = widget
+        self.tag = tag
+        self.value = ""
+        self.on_text = on_text
+        self._ticker_bound = True
+
+    def configure(self, text=None, **options):
+        if options:
+            self.widget.tag_configure(self.tag, **options)
+        if text is not None and text != self.value:
+            self.value = text
+            if self.on_text:
+                self.on_text()
+
+    config = configure
+
+    def cget(self, option):
+        if option == "text":
+            return self.value
+        return self.widget.tag_cget(self.tag, option)
+
+class TextTask(Task):
+    def __init__(self, *args, **kwargs):
+        self.item_text = None
+        self.editor = None
+        self.editing = None
+        self.due_tags = {}
+        self._rendering = False
+        super().__init__(*args, **kwargs)
+
+    def _deadline_labels(self):
+        return list(self.due_tags.values())
+
+    def release(self):
+        self._finish_edit()
+        super().release()
+
+    def _ensure_item_text(self):
+        if self.item_text is None:
+            text = self.item_text = tk.Text(
+                self.frame, height=1, width=34, wrap="none", cursor="arrow",
+                borderwidth=0, highlightthickness=0, font=("Segoe UI", 10), state="disabled"
+            )
+            text.pack(fill="x", pady=2)
+            text.tag_configure("done", overstrike=1, foreground=CHECKED_TEXT_COLOR)
+            for tag in ("check", "deadline", "delete", "label"):
+                text.tag_configure(tag, spacing1=2, spacing3=2)
+            text.tag_bind("check", "<Button-1>", self._on_check_click)
+            text.tag_bind("deadline", "<Button-1>", self._on_deadline_click)
+            text.tag_bind("delete", "<Button-1>", self._on_delete_click)
+            text.tag_bind("label", "<Button-1>", self._on_label_click)
+            self._color_item_text()
+        return self.item_text
+
+    def _color_item_text(self):
+        text_color = self.get_text_color()
+        self.item_text.configure(bg=self.color, fg=text_color)
+        if self.editor is not None:
+            self.editor.configure(bg=self.color, fg=text_color, insertbackground=text_color)
+
+    def apply_color(self):
+        if self.theme.color_group(self.style, self.color) and self.item_text is not None:
+            self._color_item_text()
+        self.due_label.config(text=self.get_due_text())
+
+    def _build_item_batch(self):
+        self._expand_job = None
+        self._ensure_item_text()
+        items = self.visible_items()
+        end = min(self._rows_limit, len(items))
+        for item in items[len(self.checkboxes):end]:
+            self._add_item_row(item)
+        self._update_more_button()
+        self._notify_resize()
+
+    def _clear_item_rows(self):
+        self._cancel_expand()
+        self._cancel_edit()
+        for deadline_label in self.due_tags.values():
+            self.ticker.discard(deadline_label)
+        if self.item_text is not None:
+            text = self.item_text
+            if self.due_tags:
+                text.tag_delete(*(label.tag for label in self.due_tags.values()))
+            row_tags = [f"row{row.item.id}" for row in self.checkboxes]
+            if row_tags:
+                text.tag_delete(*row_tags)
+            text.configure(state="normal")
+            text.delete("1.0", "end")
+            text.configure(state="disabled", height=1)
+        self.due_tags = {}
+        self.checkboxes = RowList()
+        self._rows_limit = 0
+        self.more_button.pack_forget()
+
+    def _add_item_row(self, item, before=None):
+        self._render_row(self.checkboxes.insert(ItemRow(item), before))
+
+    def add_checkbox(self, label="", checked=False, deadline=None):
+        super().add_checkbox(label, checked, deadline)
+        last = self.checkboxes.last
+        if not label and last is not None and last.item is self.group.items[-1]:
+            self._edit_row(last)
+
+    def _focus_row(self, row):
+        self._edit_row(row)
+
+    def _due_label(self, item):
+        label = self.due_tags.get(item.id)
+        if label is None:
+            label = self.due_tags[item.id] = TagLabel(self.item_text, f"due{item.id}", lambda: self._due_changed(item))
+        return label
+
+    def _due_changed(self, item):
+        if not self._rendering:
+            row = self.checkboxes.get(item.id)
+            if row is not None:
+                self._render_row(row, replace=True)
+
+    def _row_chunks(self, item):
+        row_tag = f"row{item.id}"
+        label = item.label.replace("\n", " ↵ ") or " "
+        chunks = [
+            "☑" if item.checked else "☐", ("check", row_tag),
+            " ", (row_tag,),
+            label, ("label", "done", row_tag) if item.checked else ("label", row_tag),
+            "  ", (row_tag,),
+            "📅", ("deadline", row_tag),
+        ]
+        if item.deadline:
+            due = self._due_label(item)
+            self._rendering = True
+            try:
+                self.get_checkbox_due_text(due, item)
+            finally:
+                self._rendering = False
+            chunks += [" ", (row_tag,), due.value or " ", (due.tag, row_tag)]
+        elif item.id in self.due_tags:
+            label = self.due_tags.pop(item.id)
+            self.ticker.discard(label)
+            self.item_text.tag_delete(label.tag)
+        chunks += ["  ", (row_tag,), "✖", ("delete", row_tag)]
+        return chunks
+
+    def _render_row(self, row, replace=False):
+        text = self.item_text
+        chunks = self._row_chunks(row.item)
+        text.configure(state="normal")
+        if replace:
+            start, end = text.tag_ranges(f"row{row.item.id}")
+            text.delete(start, end)
+            text.insert(start, *chunks)
+        elif row.next is not None:
+            text.insert(text.tag_ranges(f"row{row.next.item.id}")[0], *chunks, "\n", ())
+        else:
+            if row.prev is not None:
+                text.insert("end-1c", "\n")
+            text.insert("end-1c", *chunks)
+        text.configure(state="disabled", height=max(1, len(self.checkboxes)))
+
+    def refresh_item(self, item):
+        row = self.checkboxes.get(item.id)
+        if row is None:
+            return
+        if self.editing is item:
+            self._cancel_edit()
+        self._render_row(row, replace=True)
+        self.update_counts()
+
+    def _delete_row(self, row):
+        text = self.item_text
+        row_tag = f"row{row.item.id}"
+        start, end = text.tag_ranges(row_tag)
+        text.configure(state="normal")
+        if row.next is not None:
+            text.delete(start, f"{end}+1c")
+        elif row.prev is not None:
+            text.delete(f"{start}-1c", end)
+        else:
+            text.delete("1.0", "end")
+        text.tag_delete(row_tag)
+        self.checkboxes.remove(row.item.id)
+        text.configure(state="disabled", height=max(1, len(self.checkboxes)))
+
+    def _row_at(self, event):
+        for tag in self.item_text.tag_names(f"@{event.x},{event.y}"):
+            if tag.startswith("row"):
+                return self.checkboxes.get(int(tag[3:]))
+        return None
+
+    def _on_check_click(self, event):
+        row = self._row_at(event)
+        if row is not None:
+            self.board.set_item_checked(self.group, row.item, not row.item.checked)
+            self._render_row(row, replace=True)
+            self.update_counts()
+        return "break"
+
+    def _on_deadline_click(self, event):
+        row = self._row_at(event)
+        if row is not None:
+            self.set_checkbox_deadline(row.item, self._due_label(row.item))
+        return "break"
+
+    def _on_delete_click(self, event):
+        row = self._row_at(event)
+        if row is None:
+            return "break"
+        self.board.remove_item(self.group, row.item)
+        self.item_removed(row.item)
+        return "break"
+
+    def _remove_item_row(self, row):
+        item = row.item
+        if self.editing is item:
+            self._cancel_edit()
+        label = self.due_tags.pop(item.id, None)
+        if label is not None:
+            self.ticker.discard(label)
+            self.item_text.tag_delete(label.tag)
+        self._delete_row(row)
+
+    def _on_label_click(self, event):
+        row = self._row_at(event)
+        if row is not None:
+            self._edit_row(row)
+        return "break"
+
+    def _edit_row(self, row):
+        self._finish_edit()
+        text = self.item_text
+        start = text.tag_ranges(f"row{row.item.id}")[0]
+        text.see(start)
+        text.update_idletasks()
+        bbox = text.bbox(start)
+        if bbox is None:
+            return
+        item = row.item
+        if self.editor is None:
+            self.editor = tk.Text(text, height=1, wrap=tk.WORD, font=("Segoe UI", 10), relief="solid", borderwidth=1)
+            self.editor.bind("<Return>", self._finish_edit)
+            self.editor.bind("<Shift-Return>", lambda e: None)
+            self.editor.bind("<Escape>", self._cancel_edit)
+            self.editor.bind("<FocusOut>", self._finish_edit)
+            self.editor.bind("<Tab>", lambda e: self._edit_next(1))
+            self.editor.bind("<Shift-Tab>", lambda e: self._edit_next(-1))
+            self._color_item_text()
+        self.editor.delete("1.0", "end")
+        self.editor.insert("1.0", item.label)
+        self.editor.configure(height=min(3, item.label.count("\n") + 1))
+        self.editor.place(x=0, y=bbox[1], relwidth=1)
+        self.editor.focus_set()
+        self.editing = item
+
+    def _edit_next(self, step):
+        item = self.editing
+        if item is None:
+            return "break"
+        self._finish_edit()
+        if step > 0:
+            return self.focus_next_entry(item.id)
+        return self.focus_prev_entry(item.id)
+
+    def _finish_edit(self, event=None):
+        item = self.editing
+        if item is not None:
+            self.editing = None
+            label = self.editor.get("1.0", "end-1c")
+            self.editor.place_forget()
+            row = self.checkboxes.get(item.id)
+            if row is not None and label != item.label:
+                self.board.set_item_text(self.group, item, label)
+                self._render_row(row, replace=True)
+        return "break"
+
+    def _cancel_edit(self, event=None):
+        self.editing = None
+        if self.editor is not None:
+            self.editor.place_forget()
+        return "break"
+
+TASK_RENDERERS = {"widgets": Task, "text": TextTask}
+
+def grid_rows(count, columns):
+    for start in range(0, count, columns):
+        end = min(start + columns, count)
+        yield start // columns, start, end, (columns - (end - start)) // 2
+
+class GridLayout:
+    def __init__(self, frame):
+        self.frame = frame
+        self.cells = {}
+        self.weights = set()
+
+    def place(self, widgets, columns):
+        cells = {}
+        weights = set()
+        for row, start, end, pad in grid_rows(len(widgets), columns):
+            weights.update(range(pad + 1, columns + pad + 2))
+            weights.add(0)
+            for i, widget in enumerate(widgets[start:end]):
+                cells[widget] = (row, i + 1 + pad)
+
+        moved = 0
+        for widget in self.cells:
+            if widget not in cells and widget.winfo_exists():
+                widget.grid_forget()
+        for widget, cell in cells.items():
+            if self.cells.get(widget) != cell:
+                widget.grid(row=cell[0], column=cell[1], padx=5, pady=5, sticky="nsew")
+                moved += 1
+        for col in self.weights - weights:
+            self.frame.grid_columnconfigure(col, weight=0)
+        for col in weights - self.weights:
+            self.frame.grid_columnconfigure(col, weight=1)
+        self.cells = cells
+        self.weights = weights
+        return moved
+
+    def clear(self):
+        self.cells = {}
+
+class VirtualBoard:
+    def __init__(self, app):
+        self.app = app
+        self.canvas = app.canvas
+        self.width = 0
+        self.heights = {}
+        self.cells = {}
+        self.row_tops = []
+        self.rows = []
+        self.total_height = 0
+        self.live = {}
+        self.pool = []
+        self._refresh_id = None
+
+    def estimate_height(self, group):
+        measured = self.heights.get(group.id)
+        if measured and measured[0] == self.shape(group):
+            return measured[1]
+        if group.collapsed:
+            return VIRTUAL_HEADER_HEIGHT
+        return VIRTUAL_HEADER_HEIGHT + VIRTUAL_ROW_HEIGHT * min(group.item_count(), ITEM_PAGE_SIZE)
+
+    def shape(self, group):
+        item_filter = self.app.item_filter(group)
+        return (group.collapsed, group.item_count(), None if item_filter is None else len(item_filter))
+
+    def layout(self):
+        groups = self.app.visible_groups()
+        columns = self.app.columns
+        width = self.width or max(self.canvas.winfo_width(), columns * TASK_WIDTH_ESTIMATE)
+        col_width = width // columns
+        self.cells = {}
+        self.row_tops = []
+        self.rows = []
+        y = 0
+        for _, start, end, pad in grid_rows(len(groups), columns):
+            row = groups[start:end]
+            row_height = max(self.estimate_height(g) for g in row)
+            for i, group in enumerate(row):
+                x = (i + pad) * col_width + 5
+                self.cells[group.id] = (x, y + 5, col_width - 10, row_height)
+            self.row_tops.append(y)
+            self.rows.append(row)
+            y += row_height + 10
+        self.total_height = y
+        self.canvas.configure(scrollregion=(0, 0, width, y))
+        self.refresh()
+
+    def schedule_refresh(self):
+        if self._refresh_id is None:
+            self._refresh_id = self.canvas.after_idle(self.refresh)
+
+    def visible_rows(self):
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = max(0, bisect_right(self.row_tops, top - VIRTUAL_OVERSCAN) - 1)
+        last = bisect_left(self.row_tops, bottom + VIRTUAL_OVERSCAN)
+        return self.rows[first:last]
+
+    def refresh(self):
+        self._refresh_id = None
+        wanted = {}
+        for row in self.visible_rows():
+            for group in row:
+                wanted[group.id] = group
+        for group_id in [gid for gid in self.live if gid not in wanted]:
+            self.release(group_id)
+        for group_id, group in wanted.items():
+            cell = self.cells[group_id]
+            x, y, w, h = cell
+            if group_id in self.live:
+                task, window, placed = self.live[group_id]
+                if placed == cell:
+                    continue
+                self.canvas.coords(window, x, y)
+                self.canvas.itemconfigure(window, width=w, height=h)
+            else:
+                task = self.acquire(group)
+                window = self.canvas.create_window(x, y, window=task.container, anchor="nw", width=w, height=h)
+            self.live[group_id] = (task, window, cell)
+        if wanted:
+            self.canvas.after_idle(self.measure)
+
+    def measure(self):
+        changed = False
+        for group_id, (task, _, _) in list(self.live.items()):
+            if not task.container.winfo_exists():
+                continue
+            height = task.container.winfo_reqheight()
+            shape = self.shape(task.group)
+            if self.heights.get(group_id) != (shape, height):
+                self.heights[group_id] = (shape, height)
+                changed = True
+        if changed:
+            self.layout()
+
+    def acquire(self, group):
+        item_filter = self.app.item_filter(group)
+        if self.pool:
+            task = self.pool.pop()
+            task.item_filter = item_filter
+            task.bind_group(group)
+            return task
+        return self.app.task_class(
+            self.canvas, group, self.app.board, self.app.theme, self.app.ticker, self.app.layout_scheduler,
+            remove_callback=self.app.remove_task, resize_callback=self.schedule_refresh,
+            item_filter=item_filter, focus_callback=self.app.focus_neighbor_group
+        )
+
+    def release(self, group_id):
+        task, window, _ = self.live.pop(group_id)
+        self.canvas.delete(window)
+        if not task.container.winfo_exists():
             return
-        flash_state = getattr(deadline_label, '_flash_state', False)
+        task.release()
+        if len(self.pool) < max(4, len(self.live)):
+            self.pool.append(task)
+        else:
+            task.container.destroy()
+
+    def task_for(self, group):
+        entry = self.live.get(group.id)
+        return entry[0] if entry else None
+
+    def live_tasks(self):
+        return [task for task, _, _ in self.live.values()]
+
+    def ensure_visible(self, group):
+        cell = self.cells.get(group.id)
+        if cell is None:
+            return None
+        top = self.canvas.canvasy(0)
+        height = self.canvas.winfo_height()
+        if cell[1] < top or cell[1] + min(cell[3], height) > top + height:
+            self.canvas.yview_moveto(cell[1] / max(1, self.total_height))
+        self.refresh()
+        return self.task_for(group)
+
+    def forget(self, group):
+        self.heights.pop(group.id, None)
+        entry = self.live.pop(group.id, None)
+        if entry:
+            self.canvas.delete(entry[1])
 
-        if flash_state:
-            deadline_label.configure(bg="#ff4444", fg="#ffffff")
+    def clear(self):
+        if self._refresh_id is not None:
+            self.canvas.after_cancel(self._refresh_id)
+            self._refresh_id = None
+        for task, window, _ in self.live.values():
+            self.canvas.delete(window)
+            task.release()
+            task.container.destroy()
+        for task in self.pool:
+            task.container.destroy()
+        self.live.clear()
+        self.pool = []
+        self.heights.clear()
+        self.cells = {}
+        self.rows = []
+        self.row_tops = []
+
+class ArchiveView:
+    def __init__(self, app):
+        self.app = app
+        self.tab = app.active_tab
+        self.archive = ArchiveStore(archive_path(app.current_file))
+        self.page_number = 0
+        self.records = []
+        self.top = tk.Toplevel(app.root)
+        self.top.title(f"Archive - {os.path.basename(app.current_file)}")
+        self.listbox = tk.Listbox(self.top, width=70, height=20, activestyle="none")
+        self.listbox.pack(fill="both", expand=True, padx=10, pady=(10, 5))
+        self.listbox.bind("<Double-Button-1>", self.restore)
+
+        btn_frame = tk.Frame(self.top)
+        btn_frame.pack(fill="x", padx=10, pady=(0, 10))
+        self.newer_btn = tk.Button(btn_frame, text="◀ Newer", command=lambda: self.show_page(self.page_number - 1))
+        self.newer_btn.pack(side="left")
+        self.older_btn = tk.Button(btn_frame, text="Older ▶", command=lambda: self.show_page(self.page_number + 1))
+        self.older_btn.pack(side="left", padx=5)
+        self.page_label = tk.Label(btn_frame)
+        self.page_label.pack(side="left", padx=10)
+        tk.Button(btn_frame, text="Restore", command=self.restore).pack(side="right")
+        self.show_page(0)
+
+    @staticmethod
+    def describe(record):
+        if "data" in record:
+            text = f"{record.get('group', '')} (group, {len(record['data'].get('checkboxes', []))} items)"
         else:
-            deadline_label.configure(bg="#ffffff", fg="#ff4444")
+            text = f"{record.get('group', '')}: {record['item'][0]}"
+        return f"{record.get('archived', '')}  {text}"
+
+    def show_page(self, number):
+        count = self.archive.count()
+        pages = max(1, -(-count // ARCHIVE_PAGE_SIZE))
+        self.page_number = min(max(0, number), pages - 1)
+        self.records = self.archive.page(self.page_number) if count else []
+        self.listbox.delete(0, "end")
+        for _, record in self.records:
+            self.listbox.insert("end", self.describe(record))
+        self.page_label.config(text=f"Page {self.page_number + 1}/{pages} ({count} archived)")
+        self.newer_btn.config(state="normal" if self.page_number > 0 else "disabled")
+        self.older_btn.config(state="normal" if self.page_number < pages - 1 else "disabled")
+
+    def restore(self, event=None):
+        selection = self.listbox.curselection()
+        if not selection:
+            return
+        offset, record = self.records[selection[0]]
+        if self.tab not in self.app.tabs:
+            self.top.destroy()
+            return
+        self.app.switch_board(self.tab)
+        try:
+            self.app.restore_archived(record)
+            self.archive.remove(offset)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to restore item: {str(e)}", parent=self.top)
+        self.show_page(self.page_number)
+
+BOARD_STATE = (
+    "current_file", "store", "board", "history", "dirty", "edit_generation", "autosave_target",
+    "canvas", "scrollbar", "task_frame", "task_frame_window", "layout", "virtual", "tasks",
+    "_tasks_by_group", "_group_pos", "_pending_groups", "_load_pos", "search_index", "search_filter",
+    "_last_canvas_width", "disk_hashes", "unsaved_groups",
+)
+
+class BoardTab:
+    def __init__(self, path, history=None):
+        self.current_file = path
+        self.store = None
+        self.board = None
+        self.history = history or UndoHistory()
+        self.dirty = False
+        self.edit_generation = 0
+        self.autosave_target = True
+        self.canvas = None
+        self.scrollbar = None
+        self.task_frame = None
+        self.task_frame_window = None
+        self.layout = None
+        self.virtual = None
+        self.tasks = []
+        self._tasks_by_group = {}
+        self._group_pos = None
+        self._pending_groups = set()
+        self._load_pos = 0
+        self.search_index = None
+        self.search_filter = None
+        self._last_canvas_width = 0
+        self.disk_hashes = {}
+        self.unsaved_groups = set()
+        self.watch_signature = None
+        self.button = None
 
-        deadline_label._flash_state = not flash_state
-        deadline_label._flash_id = deadline_label.after(400, lambda: self._flash_single_checkbox_due_label(deadline_label))
+    @property
+    def name(self):
+        return os.path.basename(self.current_file)
+
+    def stash(self, app):
+        for name in BOARD_STATE:
+            setattr(self, name, getattr(app, name))
+
+    def restore(self, app):
+        for name in BOARD_STATE:
+            setattr(app, name, getattr(self, name))
+
+    def release_widgets(self):
+        if self.canvas is None:
+            return
+        if self.virtual is not None:
+            self.virtual.clear()
+        for task in self.tasks:
+            task.release()
+        self.canvas.destroy()
+        self.scrollbar.destroy()
+        self.canvas = self.scrollbar = self.task_frame = self.task_frame_window = None
+        self.layout = self.virtual = None
+        self.tasks = []
+        self._tasks_by_group = {}
+        self._pending_groups = set()
+        self._load_pos = 0
 
 class TaskManagerApp:
-    def __init__(self, root):
+    def __init__(self, root, profile=None, instrument=False):
         self.root = root
+        self.profile = profile
+        self.instrumentation = None
+        if instrument:
+            self.enable_instrumentation()
         self.root.title("🐮 TaskBarn")
+        self.bus = ChangeBus(root)
+        self.bus.subscribe(self.on_board_changes)
+        self.bus.subscribe(self.on_search_changes, (GROUP_ADDED, GROUP_REMOVED, GROUP_TITLE, ITEM_ADDED, ITEM_REMOVED, ITEM_TEXT))
+        self.search_index = None
+        self.search_filter = None
+        self._filter_job = None
+        self.history = UndoHistory()
+        self.board = Board(bus=self.bus, history=self.history)
         self.tasks = []
         self.dirty = False
         self.sort_method = tk.StringVar(value="created")
-        self.bg_color = "#f0f0f0"
-        self.fg_color = "#000000"
+        self.sort_descending = tk.BooleanVar(value=False)
+        self.ticker = FlashTicker(root)
+        self.theme = Theme(root)
+        self.layout_scheduler = LayoutScheduler(root)
         self._loading = True
         self._resize_after_id = None
         self._last_canvas_width = 0
+        self.columns = 3
+        self.virtual = None
+        self.layout = None
+        self.canvas = None
+        self.scrollbar = None
+        self.task_frame = None
+        self.task_frame_window = None
+        self._pending_groups = set()
+        self._load_pos = 0
+        self._load_job = None
+        self._group_pos = None
+        self._tasks_by_group = {}
+        self.edit_generation = 0
+        self.autosave_target = True
+        self.autosaver = AutoSaver(self)
+        self.disk_hashes = {}
+        self.unsaved_groups = set()
+        self.watcher = FileWatcher(root, self.on_file_changed)
         
         config = self.load_config()
         self.current_file = config.get('last_file', SAVE_FILE)
+        self.storage_mode = config.get('storage', 'json')
+        self.store = open_store(self.current_file, self.storage_mode)
+        self.virtual_mode = config.get('virtual_board', 'auto')
+        self.task_class = TASK_RENDERERS.get(config.get('item_renderer', 'widgets'), Task)
+        self.autosaver.enabled = config.get('autosave', True)
+        self.autosaver.delay = config.get('autosave_delay_ms', AUTOSAVE_DELAY_MS)
+        self.history.limit_bytes = config.get('undo_memory_kb', UNDO_MEMORY_KB) * 1024
+        self.max_live_boards = max(1, config.get('max_live_boards', MAX_LIVE_BOARDS))
+        self.archive_after_days = config.get('archive_after_days')
+        self.watch_file = config.get('watch_file', True)
+        self.active_tab = BoardTab(self.current_file, self.history)
+        self.tabs = [self.active_tab]
+        self.live_tabs = [self.active_tab]
+        for path in config.get('open_files', []):
+            if path != self.current_file:
+                self.tabs.append(BoardTab(path, UndoHistory(self.history.limit_bytes)))
+        self.theme.use(config.get('theme', 'light'))
+        if config.get('instrument'):
+            self.enable_instrumentation()
+        self.theme_name = tk.StringVar(value=self.theme.name)
         win_size = config.get('window_size')
         was_maximized = config.get('maximized', False)
         if win_size:
             self.root.geometry(win_size)
         if was_maximized:
             self.root.state('zoomed')
+        if self.profile:
+            self.profile.mark("config read")
 
         self.menu_bar = tk.Menu(root)
         self.root.config(menu=self.menu_bar)
@@ -576,51 +3506,262 @@ class TaskManagerApp:
         self.file_menu.add_command(label="Save", command=self.save_tasks, accelerator="Ctrl+S")
         self.file_menu.add_command(label="Save As...", command=self.save_as)
         self.file_menu.add_command(label="Open...", command=self.load_from)
+        self.file_menu.add_command(label="Open in New Tab...", command=self.open_tab_from, accelerator="Ctrl+T")
+        self.file_menu.add_command(label="Close Tab", command=self.close_tab, accelerator="Ctrl+W")
         self.file_menu.add_separator()
         self.file_menu.add_command(label="Exit", command=self.on_close)
 
+        self.edit_menu = tk.Menu(self.menu_bar, tearoff=0)
+        self.menu_bar.add_cascade(label="Edit", menu=self.edit_menu)
+        self.edit_menu.add_command(label="Undo", command=self.undo, accelerator="Ctrl+Z")
+        self.edit_menu.add_command(label="Redo", command=self.redo, accelerator="Ctrl+Y")
+        self.edit_menu.add_separator()
+        self.edit_menu.add_command(label="Archive Completed Items", command=self.archive_now)
+        self.edit_menu.add_command(label="Browse Archive...", command=self.browse_archive)
+
+        self.view_menu = tk.Menu(self.menu_bar, tearoff=0)
+        self.menu_bar.add_cascade(label="View", menu=self.view_menu)
+        self.view_menu.add_command(label="Due Soon...", command=self.show_due_soon)
+        self.view_menu.add_separator()
+        for name in APP_THEMES:
+            self.view_menu.add_radiobutton(label=f"{name.title()} Theme", value=name, variable=self.theme_name, command=self.set_theme)
+        if self.instrumentation is not None:
+            self.view_menu.add_separator()
+            self.view_menu.add_command(label="Performance Overlay", command=self.instrumentation.toggle_overlay, accelerator="F12")
+            self.view_menu.add_command(label="Dump Trace", command=self.dump_trace, accelerator="Ctrl+Shift+T")
+            self.root.bind("<F12>", self.instrumentation.toggle_overlay)
+            self.root.bind("<Control-T>", self.dump_trace)
+
         self.root.bind("<Control-s>", self.save_tasks)
+        self.root.bind("<Control-z>", self.undo)
+        self.root.bind("<Control-y>", self.redo)
+        self.root.bind("<Control-Z>", self.redo)
+        self.root.bind("<Control-t>", lambda e: self.open_tab_from())
+        self.root.bind("<Control-w>", lambda e: self.close_tab())
+        self.root.bind("<Control-Tab>", lambda e: self.cycle_tab(1))
 
-        sort_frame = tk.Frame(root, bg=self.bg_color)
+        self.root.configure(bg=self.theme.colors["bg"])
+        self.tab_bar = ttk.Frame(root, style="App.TFrame")
+        self.tab_bar.pack(padx=10, pady=(5, 0), fill="x")
+        self.tab_var = tk.IntVar(value=0)
+        self.update_tab_bar()
+        sort_frame = ttk.Frame(root, style="App.TFrame")
         sort_frame.pack(padx=10, pady=(0, 5), fill="x", before=None)
-        tk.Label(sort_frame, text="Sort by:", bg=self.bg_color, fg=self.fg_color).pack(side="left")
+        ttk.Label(sort_frame, text="Sort by:", style="App.TLabel").pack(side="left")
         sort_labels = [label for label, _ in SORT_OPTIONS]
-        sort_menu = tk.OptionMenu(sort_frame, self.sort_method, *sort_labels, command=self.sort_and_place_tasks)
-        self.sort_method.set(sort_labels[0])
-        sort_menu.config(bg=self.bg_color, fg=self.fg_color, highlightthickness=0, activebackground=self.bg_color, activeforeground=self.fg_color)
+        sort_menu = ttk.OptionMenu(sort_frame, self.sort_method, sort_labels[0], *sort_labels, command=self.sort_and_place_tasks, style="App.TMenubutton")
         sort_menu.pack(side="left", padx=5)
+        ttk.Checkbutton(sort_frame, text="Descending", variable=self.sort_descending, command=self.sort_and_place_tasks, style="App.TCheckbutton").pack(side="left")
+        ttk.Label(sort_frame, text="Search:", style="App.TLabel").pack(side="left", padx=(15, 0))
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(sort_frame, textvariable=self.search_var, width=30, style="App.TEntry")
+        self.search_entry.pack(side="left", padx=5)
+        self.search_entry.bind("<Escape>", lambda e: self.search_var.set(""))
+        self.search_var.trace_add("write", self.schedule_filter)
+        self.root.bind("<Control-f>", lambda e: self.search_entry.focus_set())
+        self.status_label = ttk.Label(sort_frame, text="", style="App.TLabel")
+        self.status_label.pack(side="right")
 
-        entry_frame = tk.Frame(root, bg=self.bg_color)
+        entry_frame = ttk.Frame(root, style="App.TFrame")
         entry_frame.pack(padx=10, pady=(4, 0), fill="x")
 
-        self.entry = tk.Entry(entry_frame, bg=self.bg_color, fg=self.fg_color, font=("Segoe UI", 20), width=30, justify="center")
+        self.entry = ttk.Entry(entry_frame, font=("Segoe UI", 20), width=30, justify="center", style="App.TEntry")
         self.entry.pack(side="left", pady=0, padx=(0, 8), expand=True, fill="x")
         self.entry.bind("<Return>", lambda e: self.add_task())
 
-        self.add_task_btn = tk.Button(entry_frame, text="➕ Add Group", command=self.add_task, bg=self.bg_color, fg=self.fg_color)
+        self.add_task_btn = ttk.Button(entry_frame, text="➕ Add Group", command=self.add_task, style="App.TButton")
         self.add_task_btn.pack(side="left", pady=0)
 
-        self.canvas = tk.Canvas(root, bg=self.bg_color, highlightthickness=0)
-        self.canvas.pack(side="left", fill="both", expand=True)
+        self.build_board_view()
+        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.root.bind_all("<Button-4>", self._on_mousewheel)
+        self.root.bind_all("<Button-5>", self._on_mousewheel)
 
-        self.scrollbar = tk.Scrollbar(root, orient="vertical", command=self.canvas.yview, bg=self.bg_color, troughcolor=self.bg_color, activebackground=self.bg_color)
-        self.scrollbar.pack(side="right", fill="y")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        if self.profile:
+            self.profile.mark("widget construction")
+        self.load_tasks()
+        self.watch_current_file()
+        if self.profile:
+            self.profile.mark("board build")
+        self._loading = False
 
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+    def build_board_view(self):
+        self.canvas = tk.Canvas(self.root, bg=self.theme.colors["bg"], highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=self.canvas.yview, style="App.Vertical.TScrollbar")
+        self.show_board_view()
+
+        self.canvas.configure(yscrollcommand=self._on_canvas_scroll)
         self.canvas.bind("<Configure>", self.on_canvas_resize)
-        
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
 
-        self.task_frame = tk.Frame(self.canvas, bg=self.bg_color)
-        self.canvas.create_window((0, 0), window=self.task_frame, anchor="nw", width=self.canvas.winfo_width())
+        self.task_frame = ttk.Frame(self.canvas, style="App.TFrame")
+        self.task_frame_window = self.canvas.create_window((0, 0), window=self.task_frame, anchor="nw", width=self.canvas.winfo_width())
 
-        self.task_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        self.task_frame.bind("<Configure>", self._on_task_frame_configure)
+        self.layout = GridLayout(self.task_frame)
+        self.virtual = None
+        self.tasks = []
+        self._last_canvas_width = 0
 
-        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
-        self.load_tasks()
-        self._loading = False
+    def show_board_view(self):
+        self.canvas.configure(bg=self.theme.colors["bg"])
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+    def hide_board_view(self):
+        if self.virtual is not None and self.virtual._refresh_id is not None:
+            self.canvas.after_cancel(self.virtual._refresh_id)
+            self.virtual._refresh_id = None
+        self.canvas.pack_forget()
+        self.scrollbar.pack_forget()
+
+    def update_tab_bar(self):
+        for child in self.tab_bar.winfo_children():
+            child.destroy()
+        for i, tab in enumerate(self.tabs):
+            tab.button = ttk.Radiobutton(
+                self.tab_bar, text=tab.name, value=i, variable=self.tab_var,
+                command=lambda t=tab: self.switch_board(t), style="App.Toolbutton"
+            )
+            tab.button.pack(side="left", padx=(0, 2))
+        self.tab_var.set(self.tabs.index(self.active_tab))
+
+    def switch_board(self, tab):
+        if tab is self.active_tab:
+            return
+        self.bus.flush()
+        self.autosaver.shutdown()
+        self.store.wait()
+        if self.dirty and self.autosave_target and self.autosaver.enabled:
+            self.save_tasks()
+        if self._load_job is not None:
+            self.root.after_cancel(self._load_job)
+            self._load_job = None
+        self.hide_board_view()
+        self.active_tab.watch_signature = self.watcher.signature if self.watcher.active() else None
+        self.active_tab.stash(self)
+        self.active_tab = tab
+        tab.restore(self)
+        if self.store is None:
+            self.store = open_store(self.current_file, self.storage_mode, detect=True)
+        if tab in self.live_tabs:
+            self.live_tabs.remove(tab)
+        self.live_tabs.append(tab)
+        self._loading = True
+        try:
+            if self.canvas is not None:
+                self.show_board_view()
+                self.sort_and_place_tasks()
+                if self._pending_groups:
+                    self._load_job = self.root.after(1, self._load_next_batch)
+            elif self.board is None:
+                self.build_board_view()
+                self.board = Board(bus=self.bus, history=self.history)
+                self.load_tasks()
+            else:
+                self.build_board_view()
+                with self.layout_scheduler.bulk():
+                    self.build_board()
+        finally:
+            self._loading = False
+        self.evict_boards()
+        self.schedule_filter()
+        self._update_load_status()
+        self.tab_var.set(self.tabs.index(tab))
+        self.root.title(f"🐮 TaskBarn - {tab.name}")
+        self.watch_current_file(tab.watch_signature)
+
+    def evict_boards(self):
+        while len(self.live_tabs) > self.max_live_boards:
+            tab = self.live_tabs.pop(0)
+            tab.release_widgets()
+
+    def open_tab(self, path):
+        for tab in self.tabs:
+            if os.path.abspath(tab.current_file) == os.path.abspath(path):
+                self.switch_board(tab)
+                return tab
+        tab = BoardTab(path, UndoHistory(self.history.limit_bytes))
+        self.tabs.append(tab)
+        self.update_tab_bar()
+        self.switch_board(tab)
+        self.save_last_file()
+        return tab
+
+    def open_tab_from(self):
+        from tkinter import filedialog
+        file_path = filedialog.askopenfilename(
+            filetypes=[("TaskBarn Files", "*.brn"), ("TaskBarn Database", "*.brndb"), ("All Files", "*.*")]
+        )
+        if file_path:
+            self.open_tab(file_path)
+
+    def cycle_tab(self, step):
+        if len(self.tabs) > 1:
+            self.switch_board(self.tabs[(self.tabs.index(self.active_tab) + step) % len(self.tabs)])
+        return "break"
+
+    def close_tab(self):
+        if len(self.tabs) < 2:
+            return
+        if self.dirty:
+            answer = messagebox.askyesnocancel(
+                "Save Changes?",
+                f"Do you want to save your changes to {self.active_tab.name}?",
+                icon="question"
+            )
+            if answer is None:
+                return
+            elif answer:
+                self.save_tasks()
+            self.dirty = False
+        closing = self.active_tab
+        index = self.tabs.index(closing)
+        self.switch_board(self.tabs[index - 1] if index else self.tabs[1])
+        self.tabs.remove(closing)
+        if closing in self.live_tabs:
+            self.live_tabs.remove(closing)
+        closing.release_widgets()
+        if closing.store is not None:
+            closing.store.wait()
+            if closing.board is not None:
+                closing.board.load_all()
+            closing.store.close()
+        self.update_tab_bar()
+        self.save_last_file()
+
+    def _on_task_frame_configure(self, event=None):
+        if self.virtual is None:
+            self.layout_scheduler.request("scrollregion", self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        if self.virtual is None:
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+    def _on_canvas_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if self.virtual is not None:
+            self.virtual.schedule_refresh()
+
+    def use_virtual_board(self, group_count):
+        if self.virtual_mode == 'auto':
+            return group_count >= VIRTUAL_BOARD_THRESHOLD
+        return bool(self.virtual_mode)
+
+    def set_virtual(self, enabled):
+        if enabled and self.virtual is None:
+            for task in self.tasks:
+                task.release()
+                task.container.destroy()
+            self.tasks = []
+            self.layout.clear()
+            self.canvas.itemconfigure(self.task_frame_window, state="hidden")
+            self.virtual = VirtualBoard(self)
+        elif not enabled and self.virtual is not None:
+            self.virtual.clear()
+            self.virtual = None
+            self.canvas.itemconfigure(self.task_frame_window, state="normal")
+            self._on_task_frame_configure()
 
     def _on_mousewheel(self, event):
         first, last = self.canvas.yview()
@@ -644,61 +3785,233 @@ class TaskManagerApp:
     
     def _do_canvas_resize(self, new_width):
         self._resize_after_id = None
-        self.canvas.itemconfig("all", width=new_width)
-        task_width_estimate = 300
-        tasks_per_row = max(1, new_width // task_width_estimate)
+        self.canvas.itemconfig(self.task_frame_window, width=new_width)
+        tasks_per_row = max(1, new_width // TASK_WIDTH_ESTIMATE)
+        if self.virtual is not None:
+            self.virtual.width = new_width
         self.place_tasks(tasks_per_row)
 
-    def mark_dirty(self, *args, **kwargs):
+    def on_board_changes(self, events):
+        if any(event.kind in (GROUP_ADDED, GROUP_REMOVED) for event in events):
+            self._group_pos = None
         if not self._loading:
             self.dirty = True
+            self.edit_generation += 1
+            self.unsaved_groups.update(event.group_id for event in events)
+            self.autosaver.schedule()
+        moves = self.board.order.take_moves() if self.board.order is not None else []
+        if moves and not self._loading:
+            self._group_pos = None
+            self._load_pos = 0
+            if self.virtual is not None:
+                self.virtual.layout()
+            else:
+                with self.layout_scheduler.bulk():
+                    self._order_tasks()
+                    self.place_tasks()
+        if self.virtual is not None:
+            self.virtual.schedule_refresh()
+
+    def on_search_changes(self, events):
+        if self.search_index is not None:
+            self.search_index.apply(events)
+
+    def schedule_filter(self, *args):
+        if self._filter_job is None:
+            self._filter_job = self.root.after_idle(self.apply_filter)
+
+    def apply_filter(self):
+        self._filter_job = None
+        query = self.search_var.get().strip()
+        if query:
+            if self.search_index is None:
+                self.bus.flush()
+                self.search_index = SearchIndex(self.board)
+            self.search_filter = self.search_index.search(query)
+        elif self.search_filter is None:
+            return
+        else:
+            self.search_filter = None
+        with self.layout_scheduler.bulk():
+            tasks = self.virtual.live_tasks() if self.virtual is not None else self.tasks
+            for task in tasks:
+                task.set_item_filter(self.item_filter(task.group))
+            if self.virtual is not None:
+                self.virtual.layout()
+            else:
+                self.place_tasks()
+        if self._pending_groups and self._load_job is None:
+            self._load_pos = 0
+            self._load_job = self.root.after(1, self._load_next_batch)
+        self._update_load_status()
+
+    def group_visible(self, group):
+        return self.search_filter is None or group.id in self.search_filter
+
+    def visible_groups(self):
+        if self.search_filter is None:
+            return self.board.groups
+        return [group for group in self.board.groups if group.id in self.search_filter]
+
+    def item_filter(self, group):
+        if self.search_filter is None:
+            return None
+        return self.search_filter.get(group.id)
 
     def add_task(self):
         title = self.entry.get().strip()
         if title:
-            task = Task(self.task_frame, title, remove_callback=self.remove_task, dirty_callback=self.mark_dirty)
-            self.tasks.append(task)
+            group = Group(title)
+            group.add_item()
+            if self.search_filter is not None:
+                self.search_filter[group.id] = None
+            self.board.add_group(group)
+            if self.virtual is None:
+                self.tasks.append(self.make_task(group))
             self.sort_and_place_tasks()
             self.entry.delete(0, tk.END)
-            self.mark_dirty()
 
     def remove_task(self, task):
-        if task in self.tasks:
+        if self.virtual is not None:
+            self.virtual.forget(task.group)
+            self.board.remove_group(task.group)
+            self.sort_and_place_tasks()
+        elif task in self.tasks:
             self.tasks.remove(task)
+            self.board.remove_group(task.group)
             self.sort_and_place_tasks()
-            self.mark_dirty()
 
-    def place_tasks(self, tasks_per_row):
-        if not self.tasks:
+    def undo(self, event=None):
+        self.show_delta(self.history.undo(self.board))
+        return "break"
+
+    def redo(self, event=None):
+        self.show_delta(self.history.redo(self.board))
+        return "break"
+
+    def show_delta(self, delta, place=True):
+        if delta is None:
             return
-            
-        for task in self.tasks:
-            task.container.grid_forget()
-            
-        for i in range(20):
-            self.task_frame.grid_columnconfigure(i, weight=0)
+        kind = delta[0]
+        if kind in ("add_group", "remove_group"):
+            group = delta[2]
+            if group in self.board.groups:
+                if self.search_filter is not None:
+                    self.search_filter[group.id] = None
+                if self.virtual is None:
+                    self._pending_groups.discard(group.id)
+                    self.tasks.append(self.make_task(group))
+            elif self.virtual is not None:
+                self.virtual.forget(group)
+            else:
+                self._pending_groups.discard(group.id)
+                task = self._tasks_by_group.get(group.id)
+                if task is not None:
+                    task.release()
+                    task.container.destroy()
+                    self.tasks.remove(task)
+            if place:
+                self.sort_and_place_tasks()
+            return
+        group = self.board.find_group(delta[1])
+        if group is None:
+            return
+        if self.virtual is not None:
+            task = self.virtual.task_for(group)
+        else:
+            task = self._tasks_by_group.get(group.id)
+        if task is not None:
+            if kind in ("add_item", "remove_item"):
+                item = delta[3]
+                if group.find_item(item.id) is item:
+                    if task.item_filter is not None:
+                        task.item_filter.add(item.id)
+                    task.item_inserted(item)
+                else:
+                    task.item_removed(item)
+            elif kind in ("title", "color", "due"):
+                task.title_label.config(text=group.title)
+                task.apply_color()
+            else:
+                item = group.find_item(delta[2])
+                if item is not None:
+                    task.refresh_item(item)
 
-        num_tasks = len(self.tasks)
-        
-        for row in range((num_tasks + tasks_per_row - 1) // tasks_per_row):
-            start = row * tasks_per_row
-            end = min(start + tasks_per_row, num_tasks)
-            num_in_row = end - start
-            pad = (tasks_per_row - num_in_row) // 2
-            
-            for col in range(tasks_per_row):
-                self.task_frame.grid_columnconfigure(col + 1 + pad, weight=1)
+    def archive_now(self):
+        self.bus.flush()
+        try:
+            moves = archive_completed(self.board, ArchiveStore(archive_path(self.current_file)), 0)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to write archive: {str(e)}")
+            return
+        if not moves:
+            self.status_label.config(text="Nothing to archive")
+            return
+        with self.layout_scheduler.bulk():
+            for group, items in moves:
+                if items is None:
+                    self.show_delta(("remove_group", 0, group), place=False)
+                else:
+                    self.show_delta(("remove_item", group.id, 0, items[0]), place=False)
+            self.sort_and_place_tasks()
+        self.save_tasks()
+        count = sum(group.item_count() if items is None else len(items) for group, items in moves)
+        self.status_label.config(text=f"Archived {count} completed items")
+
+    def show_due_soon(self):
+        if hasattr(self.store, "due_soon") and self.store.exists():
+            if self.dirty:
+                self.save_tasks()
+            rows = self.store.due_soon()
+        else:
+            self.bus.flush()
+            rows = due_soon(self.board)
+        top = tk.Toplevel(self.root)
+        top.title("Due Soon")
+        listbox = tk.Listbox(top, width=70, height=20, activestyle="none")
+        listbox.pack(fill="both", expand=True, padx=10, pady=10)
+        for due_ord, title, label in rows:
+            when = date.fromordinal(due_ord).strftime("%m/%d/%y")
+            listbox.insert("end", f"{when}  {title}: {label}" if label is not None else f"{when}  {title}")
+        if not rows:
+            listbox.insert("end", f"Nothing due in the next {DUE_SOON_DAYS} days")
+
+    def browse_archive(self):
+        ArchiveView(self)
+
+    def restore_archived(self, record):
+        self.bus.flush()
+        group, item = restore_archived(self.board, record)
+        if item is None:
+            self.show_delta(("add_group", 0, group))
+        else:
+            self.show_delta(("add_item", group.id, 0, item))
+        self.save_tasks()
+
+    def place_tasks(self, tasks_per_row=None):
+        if tasks_per_row:
+            self.columns = tasks_per_row
+        if self.virtual is not None:
+            self.virtual.layout()
+            return
+        self.layout.place([task.container for task in self.tasks if self.group_visible(task.group)], self.columns)
 
-            self.task_frame.grid_columnconfigure(0, weight=1)
-            self.task_frame.grid_columnconfigure(tasks_per_row + 1 + pad, weight=1)
+    def enable_instrumentation(self):
+        if self.instrumentation is None:
+            self.instrumentation = Instrumentation(self.root)
+            self.instrumentation.enable()
 
-            for i, task in enumerate(self.tasks[start:end]):
-                task.container.grid(row=row, column=i + 1 + pad, padx=5, pady=5, sticky="nsew")
+    def dump_trace(self, event=None):
+        try:
+            path = self.instrumentation.dump_trace()
+            self.status_label.config(text=f"Trace written to {path}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to write trace: {str(e)}")
 
     def on_close(self):
-        if not self.dirty:
-            self.save_last_file()
-            self.root.destroy()
+        others = [tab for tab in self.tabs if tab is not self.active_tab and tab.dirty]
+        if not self.dirty and not others:
+            self.exit()
             return
         answer = messagebox.askyesnocancel(
             "Save Changes?",
@@ -709,11 +4022,25 @@ class TaskManagerApp:
             return
         elif answer:
             self.save_tasks()
-            self.save_last_file()
-            self.root.destroy()
+            for tab in others:
+                try:
+                    tab.store.save(tab.board)
+                except Exception as e:
+                    messagebox.showerror("Error", f"Failed to save {tab.name}: {str(e)}")
+            self.exit()
         else:
-            self.save_last_file()
-            self.root.destroy()
+            self.exit()
+
+    def exit(self):
+        self.save_last_file()
+        self.autosaver.shutdown()
+        self.watcher.stop()
+        for tab in self.tabs:
+            store = self.store if tab is self.active_tab else tab.store
+            if store is not None:
+                store.wait()
+                store.close()
+        self.root.destroy()
 
     def load_config(self):
         try:
@@ -724,10 +4051,28 @@ class TaskManagerApp:
             pass
         return {}
 
+    def set_theme(self):
+        with self.layout_scheduler.bulk():
+            changed = self.theme.use(self.theme_name.get())
+        if changed:
+            self.root.configure(bg=self.theme.colors["bg"])
+            self.canvas.configure(bg=self.theme.colors["bg"])
+            for tab in self.live_tabs:
+                if tab is not self.active_tab and tab.canvas is not None:
+                    tab.canvas.configure(bg=self.theme.colors["bg"])
+            try:
+                config = self.load_config()
+                config['theme'] = self.theme.name
+                with open(CONFIG_FILE, 'w') as f:
+                    json.dump(config, f)
+            except Exception:
+                pass
+
     def save_last_file(self):
         try:
             config = self.load_config()
             config['last_file'] = self.current_file
+            config['open_files'] = [tab.current_file for tab in self.tabs]
             config['window_size'] = self.root.geometry()
             config['maximized'] = (self.root.state() == 'zoomed')
             with open(CONFIG_FILE, 'w') as f:
@@ -736,93 +4081,361 @@ class TaskManagerApp:
             pass
 
     def save_as(self):
+        file_type = tk.StringVar(value="TaskBarn Files")
+        from tkinter import filedialog
         file_path = filedialog.asksaveasfilename(
             defaultextension=".brn",
-            filetypes=[("TaskBarn Files", "*.brn"), ("All Files", "*.*")],
-            initialfile=self.current_file
+            filetypes=[("TaskBarn Files", "*.brn"), ("TaskBarn Compact Files (v2)", "*.brn"),
+                       ("TaskBarn Database", "*.brndb"), ("All Files", "*.*")],
+            initialfile=self.current_file,
+            typevariable=file_type
         )
         if file_path:
-            self.current_file = file_path
+            compact = file_type.get().startswith("TaskBarn Compact")
+            if file_type.get() == "TaskBarn Database" or file_path.endswith(".brndb"):
+                storage_mode = "sqlite"
+            elif compact:
+                storage_mode = "binary"
+            else:
+                storage_mode = "journal" if self.storage_mode == "journal" else "json"
+            self.set_current_file(file_path, storage_mode)
             self.save_tasks()
             self.save_last_file()
             self.root.title(f"🐮 TaskBarn - {os.path.basename(file_path)}")
 
     def load_from(self):
+        from tkinter import filedialog
         file_path = filedialog.askopenfilename(
-            filetypes=[("TaskBarn Files", "*.brn"), ("All Files", "*.*")]
+            filetypes=[("TaskBarn Files", "*.brn"), ("TaskBarn Database", "*.brndb"), ("All Files", "*.*")]
         )
         if file_path:
-            self.current_file = file_path
+            for tab in self.tabs:
+                if tab is not self.active_tab and os.path.abspath(tab.current_file) == os.path.abspath(file_path):
+                    self.switch_board(tab)
+                    return
+            self.bus.flush()
+            if self.dirty and self.autosave_target and self.autosaver.enabled:
+                self.save_tasks()
+            elif self.dirty:
+                answer = messagebox.askyesnocancel(
+                    "Save Changes?",
+                    "Do you want to save your changes before opening another file?",
+                    icon="question"
+                )
+                if answer is None:
+                    return
+                elif answer:
+                    self.save_tasks()
+            self.clear_tasks()
+            self.set_current_file(file_path)
             self.save_last_file()
-            for task in self.tasks:
-                task.container.destroy()
-            self.tasks.clear()
-            self.load_tasks()
+            self._loading = True
+            try:
+                self.load_tasks()
+            finally:
+                self._loading = False
+            self.dirty = False
             self.root.title(f"🐮 TaskBarn - {os.path.basename(file_path)}")
 
+    def set_current_file(self, path, storage_mode=None):
+        self.autosaver.shutdown()
+        self.store.wait()
+        self.board.load_all()
+        self.store.close()
+        self.current_file = self.active_tab.current_file = path
+        self.store = open_store(path, storage_mode or self.storage_mode, detect=storage_mode is None)
+        self.autosave_target = True
+        self.update_tab_bar()
+        self.watch_current_file()
+
+    def watch_current_file(self, signature=None):
+        if self.watch_file and self.autosave_target:
+            self.watcher.watch(store_paths(self.store), signature)
+        else:
+            self.watcher.stop()
+
+    def mark_saved(self, complete=True):
+        for group_id in self.unsaved_groups:
+            group = self.board.find_group(group_id) if complete else None
+            if group is not None and group.is_loaded():
+                self.disk_hashes[group_id] = group_hash(group)
+            else:
+                self.disk_hashes.pop(group_id, None)
+        if complete:
+            self.unsaved_groups = set()
+        if self.watcher.active():
+            self.watcher.sync()
+        else:
+            self.watch_current_file()
+
+    def focused_groups(self):
+        try:
+            focus = self.root.focus_get()
+        except (KeyError, tk.TclError):
+            return set()
+        if focus is None:
+            return set()
+        path = str(focus)
+        tasks = self.virtual.live_tasks() if self.virtual is not None else self.tasks
+        return {task.group.id for task in tasks if path.startswith(str(task.container) + ".")}
+
+    def on_file_changed(self):
+        if self.autosaver.saving() or self._loading:
+            return False
+        self.bus.flush()
+        self.autosaver.shutdown()
+        self._loading = True
+        try:
+            try:
+                store = open_store(self.current_file, self.storage_mode, detect=True)
+                if not store.exists():
+                    return
+                disk_board = store.load()
+                disk_board.load_all()
+                store.close()
+            except Exception as e:
+                self.status_label.config(text=f"Could not reload {os.path.basename(self.current_file)}: {e}")
+                return
+            changes, conflicts, hashes = external_changes(
+                self.board, disk_board, self.disk_hashes, self.unsaved_groups | self.focused_groups()
+            )
+            copies = []
+            if conflicts:
+                answer = messagebox.askyesnocancel(
+                    "File Changed",
+                    f"{os.path.basename(self.current_file)} was changed outside TaskBarn, and {len(conflicts)} "
+                    "group(s) you edited here were changed there too.\n\n"
+                    "Yes: keep your version\nNo: use the version on disk\nCancel: keep both",
+                    icon="warning"
+                )
+                if answer is False:
+                    changes += conflicts
+                elif answer is None:
+                    copies = [group for _, group in conflicts if group is not None]
+            top = self.canvas.yview()[0]
+            with self.layout_scheduler.bulk():
+                with self.board.untracked():
+                    for local, group in changes:
+                        if local is not None:
+                            self.board.remove_group(local)
+                            self.show_delta(("remove_group", 0, local), place=False)
+                            self.unsaved_groups.discard(local.id)
+                        if group is not None:
+                            self.board.add_group(group)
+                            self.show_delta(("add_group", 0, group), place=False)
+                self.bus.flush()
+                self.sort_and_place_tasks()
+            self.disk_hashes = hashes
+            self.store.reloaded(disk_board)
+        finally:
+            self._loading = False
+            if self.dirty:
+                self.autosaver.schedule()
+        for group in copies:
+            copy = Group.from_data(group.to_data(), id=new_id())
+            copy.title = f"{group.title} (from disk)"
+            self.board.add_group(copy)
+            self.show_delta(("add_group", 0, copy))
+        if conflicts and answer is not False:
+            for local, _ in conflicts:
+                if local is not None:
+                    self.board.dirty_groups.add(local.id)
+                    self.unsaved_groups.add(local.id)
+            self.dirty = True
+            self.autosaver.schedule()
+        self.root.update_idletasks()
+        self.canvas.yview_moveto(top)
+        if changes:
+            self.status_label.config(text=f"Reloaded {len(changes)} changed groups from disk")
+
     def save_tasks(self, event=None):
+        self.bus.flush()
+        self.autosaver.finish()
         try:
-            data = [task.get_data() for task in self.tasks]
-            with open(self.current_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self.store.save(self.board)
             self.root.title(f"🐮 TaskBarn - {os.path.basename(self.current_file)}")
             self.dirty = False
+            self.autosave_target = True
+            self.mark_saved()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save file: {str(e)}")
 
+    def can_autosave(self):
+        return self.dirty and self.autosave_target and not self._loading
+
+    def autosave_done(self, store, generation):
+        if store is not self.store:
+            return
+        if generation == self.edit_generation:
+            self.dirty = False
+        self.mark_saved(complete=generation == self.edit_generation)
+        self.root.title(f"🐮 TaskBarn - {os.path.basename(self.current_file)}")
+        if not self._pending_groups:
+            self.status_label.config(text=f"Autosaved {datetime.now():%H:%M:%S}")
+
+    def autosave_failed(self, error):
+        self.status_label.config(text=f"Autosave failed: {error}")
+
     def load_tasks(self):
-        if os.path.exists(self.current_file):
+        if self.store.exists():
             try:
-                with open(self.current_file, "r") as f:
-                    data = json.load(f)
-                    for item in data:
-                        loaded_checkboxes_data = item.get("checkboxes", [])
-                        checkboxes_to_add = []
-                        for cb_data in loaded_checkboxes_data:
-                            
-                            if isinstance(cb_data, (list, tuple)) and len(cb_data) >= 2:
-                                label = cb_data[0]
-                                checked = cb_data[1]
-                                deadline = cb_data[2] if len(cb_data) > 2 else ""
-                                checkboxes_to_add.append((label, checked, deadline))
-                            else:
-                                print(f"Skipping invalid checkbox data: {cb_data}") 
-
-                        task = Task(
-                            self.task_frame,
-                            item["title"],
-                            remove_callback=self.remove_task,
-                            checkboxes=checkboxes_to_add,
-                            dirty_callback=self.mark_dirty,
-                            due_date=item.get("due_date", ""),
-                            color=item.get("color", "#ffffff"),
-                            created=item.get("created")
-                        )
-                        self.tasks.append(task)
-                    self.sort_and_place_tasks()
+                with self.layout_scheduler.bulk():
+                    self.board = self.store.load()
+                    self.board.bus = self.bus
+                    self.board.history = self.history
+                    self.history.clear()
+                    self.search_index = None
+                    self.store.loaded(self.board)
+                    if self.profile:
+                        self.profile.mark("file parse")
+                    self.autosave_target = True
+                    self.archive_old_items()
+                    self.unsaved_groups = set()
+                    self.disk_hashes = board_hashes(self.board) if self.watch_file else {}
+                    self.build_board()
             except json.JSONDecodeError:
                 messagebox.showerror("Error", "Invalid file format")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load file: {str(e)}")
 
+    def archive_old_items(self):
+        if self.archive_after_days is None:
+            return
+        try:
+            moves = archive_completed(self.board, ArchiveStore(archive_path(self.current_file)), self.archive_after_days)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to archive completed items: {str(e)}")
+            return
+        if moves or self.board.dirty_groups:
+            self.save_tasks()
+
+    def build_board(self):
+        self.set_virtual(self.use_virtual_board(len(self.board.groups)))
+        if self.virtual is None:
+            self._pending_groups = {group.id for group in self.board.groups}
+            self._load_pos = 0
+        self.sort_and_place_tasks()
+        if self._pending_groups:
+            self._build_pending(limit=LOAD_FIRST_GROUPS)
+            self._load_job = self.root.after(1, self._load_next_batch)
+
+    def make_task(self, group):
+        return self.task_class(
+            self.task_frame, group, self.board, self.theme, self.ticker, self.layout_scheduler,
+            remove_callback=self.remove_task, focus_callback=self.focus_neighbor_group
+        )
+
+    def _build_pending(self, limit=None, budget=None):
+        deadline = time.perf_counter() + budget if budget else None
+        groups = self.board.groups
+        built = 0
+        with self.layout_scheduler.bulk():
+            while self._load_pos < len(groups) and self._pending_groups:
+                group = groups[self._load_pos]
+                self._load_pos += 1
+                if group.id not in self._pending_groups or not self.group_visible(group):
+                    continue
+                self._pending_groups.discard(group.id)
+                self.tasks.append(self.make_task(group))
+                built += 1
+                if (limit and built >= limit) or (deadline and time.perf_counter() >= deadline):
+                    break
+            self._order_tasks()
+            self.place_tasks()
+        self._update_load_status()
+        return built
+
+    def _load_next_batch(self):
+        self._load_job = None
+        self._build_pending(budget=LOAD_BATCH_SECONDS)
+        if self._pending_groups and self._load_pos < len(self.board.groups):
+            self._load_job = self.root.after(1, self._load_next_batch)
+
+    def _cancel_load(self):
+        if self._load_job is not None:
+            self.root.after_cancel(self._load_job)
+            self._load_job = None
+        self._pending_groups = set()
+        self._update_load_status()
+
+    def _update_load_status(self):
+        if self.search_filter is not None:
+            self.status_label.config(text=f"{len(self.search_filter)} matching groups")
+        elif self._pending_groups:
+            total = len(self.board.groups)
+            self.status_label.config(text=f"Loading {total - len(self._pending_groups)}/{total} groups…")
+        else:
+            self.status_label.config(text="")
+
+    def _order_tasks(self):
+        by_group = self._tasks_by_group = {task.group.id: task for task in self.tasks}
+        self.tasks = [by_group[g.id] for g in self.board.groups if g.id in by_group]
+
+    def group_position(self, group):
+        if self._group_pos is None:
+            self._group_pos = {g.id: i for i, g in enumerate(self.board.groups)}
+        return self._group_pos.get(group.id)
+
+    def focus_neighbor_group(self, task, step):
+        groups = self.board.groups
+        pos = self.group_position(task.group)
+        while pos is not None:
+            pos += step
+            if not 0 <= pos < len(groups):
+                return False
+            group = groups[pos]
+            if group.collapsed or not self.group_visible(group) or not group.item_count():
+                continue
+            if self.virtual is not None:
+                target = self.virtual.ensure_visible(group)
+            else:
+                target = self._tasks_by_group.get(group.id)
+            if target is not None and target.focus_edge(first=step > 0):
+                if self.virtual is None:
+                    self.scroll_to(target)
+                return True
+        return False
+
+    def scroll_to(self, task):
+        self.root.update_idletasks()
+        total = max(1, self.task_frame.winfo_height())
+        top, bottom = self.canvas.yview()
+        y = task.container.winfo_y() / total
+        if y < top or y + task.container.winfo_height() / total > bottom:
+            self.canvas.yview_moveto(y)
+
     def sort_and_place_tasks(self, *args):
-        method = self.sort_method.get()
-        if method == "Time Left" or method == "time_left":
-            def days_left(task):
-                try:
-                    due = datetime.strptime(task.due_date, "%m/%d/%y").date()
-                    today = datetime.now().date()
-                    return (due - today).days
-                except Exception:
-                    return float('inf')
-            self.tasks.sort(key=lambda t: (days_left(t) if t.due_date else float('inf'), t.title.lower()))
-        elif method == "Size" or method == "size":
-            self.tasks.sort(key=lambda t: (-len(t.checkboxes), t.title.lower()))
-        elif method == "Name" or method == "name":
-            self.tasks.sort(key=lambda t: t.title.lower())
-        else:
-            self.tasks.sort(key=lambda t: t.created)
-        self.place_tasks(3)
+        mode = SORT_MODES.get(self.sort_method.get(), "created")
+        self.board.sort(mode, self.sort_descending.get()).take_moves()
+        self._group_pos = None
+        self._load_pos = 0
+        if self.virtual is not None:
+            self.virtual.layout()
+            return
+        with self.layout_scheduler.bulk():
+            self._order_tasks()
+            self.place_tasks()
+
+    def clear_tasks(self):
+        self._cancel_load()
+        with self.layout_scheduler.bulk():
+            if self.virtual is not None:
+                self.virtual.clear()
+            for task in self.tasks:
+                task.release()
+                task.container.destroy()
+            self.tasks.clear()
+            self.layout.clear()
+        self.bus.cancel()
+        self.disk_hashes = {}
+        self.unsaved_groups = set()
+        self.history.clear()
+        self.board = Board(bus=self.bus, history=self.history)
+        self._group_pos = None
+        self._tasks_by_group = {}
+        self.search_index = None
+        self.search_filter = None
+        self.search_var.set("")
 
     def new_file(self):
         if self.dirty:
@@ -836,14 +4449,33 @@ class TaskManagerApp:
             elif answer:
                 self.save_tasks()
 
-        for task in self.tasks:
-            task.container.destroy()
-        self.tasks.clear()
-        self.current_file = SAVE_FILE
+        self.clear_tasks()
+        self.set_virtual(self.use_virtual_board(0))
+        self.set_current_file(SAVE_FILE)
+        self.autosave_target = False
+        self.watcher.stop()
         self.root.title("🐮 TaskBarn")
         self.dirty = False
 
 if __name__ == "__main__":
+    for flag, convert in (("--import-json", import_json), ("--export-json", export_json)):
+        if flag in sys.argv[1:]:
+            source, target = sys.argv[sys.argv.index(flag) + 1:sys.argv.index(flag) + 3]
+            board = convert(source, target)
+            print(f"Wrote {len(board.groups)} groups to {target}")
+            sys.exit(0)
+    profile = StartupProfile(_STARTUP) if "--startup-profile" in sys.argv[1:] else None
+    if profile:
+        profile.mark("imports")
     root = tk.Tk()
-    app = TaskManagerApp(root)
+    if profile:
+        profile.mark("tk init")
+    app = TaskManagerApp(root, profile=profile, instrument="--instrument" in sys.argv[1:])
+    if profile:
+        def first_paint():
+            root.update_idletasks()
+            profile.mark("first paint")
+            print(profile.report(), flush=True)
+            app.profile = None
+        root.after_idle(first_paint)
     root.mainloop()
@@ -0,0 +1,42 @@
+# Compare file size and load time of JSON .brn files against the compact v2 format.
+import os
+import tempfile
+import time
+
+from boards import make_board
+from TaskBarn import JsonStore, Brn2Store, write_brn2
+
+def best_of(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(sizes=((50, 10), (200, 40), (1000, 40))):
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "board.brn")
+        v2_path = os.path.join(tmp, "board_v2.brn")
+        print(f"{'groups':>7} {'items':>7} {'json KB':>9} {'v2 KB':>8} {'json load':>10} {'v2 index':>9} {'v2 full':>8}")
+        for groups, items in sizes:
+            board = make_board(groups, items)
+            JsonStore(json_path).save(board)
+            write_brn2(v2_path, board)
+
+            def load_v2(full):
+                store = Brn2Store(v2_path)
+                loaded = store.load()
+                if full:
+                    loaded.load_all()
+                store.close()
+
+            json_time = best_of(lambda: JsonStore(json_path).load())
+            index_time = best_of(lambda: load_v2(False))
+            full_time = best_of(lambda: load_v2(True))
+            print(f"{groups:>7} {sum(g.item_count() for g in board.groups):>7} "
+                  f"{os.path.getsize(json_path) / 1024:>9.1f} {os.path.getsize(v2_path) / 1024:>8.1f} "
+                  f"{json_time * 1000:>8.1f}ms {index_time * 1000:>7.1f}ms {full_time * 1000:>6.1f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Compare creation time, widget count and RSS of the item row renderers.
+# Needs a display; on Linux run under Xvfb (xvfb-run python bench_rows.py).
+import json
+import os
+import subprocess
+import sys
+import time
+
+import boards
+from TaskBarn import TASK_RENDERERS, FlashTicker, Group, Item, LayoutScheduler, Theme
+
+def rss_kb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+def run_child(renderer, items):
+    import tkinter as tk
+    root = tk.Tk()
+    root.withdraw()
+    group = Group("bench", items=[
+        Item(f"item {i} " + boards.WORDS[i % len(boards.WORDS)], i % 3 == 0, "01/01/30" if i % 5 == 0 else "")
+        for i in range(items)
+    ])
+    root.update()
+    before = rss_kb()
+    start = time.perf_counter()
+    task = TASK_RENDERERS[renderer](root, group, None, Theme(root), FlashTicker(root), LayoutScheduler(root))
+    task.show_more_items(len(group.items))
+    while task._expand_job is not None:
+        root.update()
+    root.update_idletasks()
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "renderer": renderer,
+        "items": len(group.items),
+        "seconds": elapsed,
+        "widgets": count_widgets(task.container),
+        "rss_kb": rss_kb() - before,
+    }))
+    root.destroy()
+
+def main(sizes=(50, 200, 1000)):
+    print(f"{'renderer':>9} {'items':>6} {'create':>9} {'widgets':>8} {'RSS KB':>8}")
+    for items in sizes:
+        for renderer in TASK_RENDERERS:
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", renderer, str(items)],
+                capture_output=True, text=True
+            )
+            if out.returncode != 0:
+                print(out.stderr.strip().splitlines()[-1] if out.stderr.strip() else "child failed")
+                return
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"{renderer:>9} {r['items']:>6} {r['seconds'] * 1000:>7.1f}ms {r['widgets']:>8} {r['rss_kb']:>8}")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
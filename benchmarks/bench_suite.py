@@ -0,0 +1,245 @@
+# Time TaskBarn's hot paths on synthetic boards and record the results as JSON.
+# Model-only benchmarks always run; GUI benchmarks need a display and start
+# Xvfb automatically on Linux when DISPLAY is unset and Xvfb is installed.
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import boards
+from bench_formats import best_of
+from TaskBarn import (
+    SORT_OPTIONS, Board, Brn2Store, JournalStore, JsonStore, SearchIndex, SqliteStore, due_soon, grid_rows,
+    import_json, write_brn2
+)
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+def model_benchmarks(args, tmp):
+    results = {}
+    board = boards.make_board(args.groups, args.items, args.due_mix, seed=args.seed)
+    data = board.to_data()
+
+    paths = {"json": os.path.join(tmp, "model.brn"), "journal": os.path.join(tmp, "journal.brn"),
+             "v2": os.path.join(tmp, "model_v2.brn"), "sqlite": os.path.join(tmp, "model.brndb")}
+    JsonStore(paths["json"]).save(board)
+    JournalStore(paths["journal"]).save(board)
+    write_brn2(paths["v2"], board)
+    import_json(paths["json"], paths["sqlite"])
+
+    results["save.json"] = best_of(lambda: JsonStore(paths["json"]).save(board), args.repeat)
+    results["save.v2"] = best_of(lambda: Brn2Store(paths["v2"]).save(board), args.repeat)
+    journal = JournalStore(paths["journal"])
+    journal.load()
+    journal.loaded(board)
+    group = board.groups[0]
+    def journal_edit():
+        board.set_title(group, group.title + "!")
+        journal.save(board)
+    results["save.journal_one_edit"] = best_of(journal_edit, args.repeat)
+    results["save.sqlite_full"] = best_of(lambda: import_json(paths["json"], os.path.join(tmp, "full.brndb")), args.repeat)
+    sqlite = SqliteStore(paths["sqlite"])
+    sqlite_board = sqlite.load()
+    sqlite.loaded(sqlite_board)
+    sqlite_group = sqlite_board.groups[0]
+    def sqlite_edit():
+        sqlite_board.set_title(sqlite_group, sqlite_group.title + "!")
+        sqlite_board.set_item_checked(sqlite_group, sqlite_group.items[0], not sqlite_group.items[0].checked)
+        sqlite.save(sqlite_board)
+    results["save.sqlite_one_edit"] = best_of(sqlite_edit, args.repeat)
+
+    results["load.json"] = best_of(lambda: JsonStore(paths["json"]).load(), args.repeat)
+    results["load.journal"] = best_of(lambda: JournalStore(paths["journal"]).load(), args.repeat)
+    def load_v2():
+        store = Brn2Store(paths["v2"])
+        store.load().load_all()
+        store.close()
+    results["load.v2_full"] = best_of(load_v2, args.repeat)
+    def load_sqlite():
+        store = SqliteStore(paths["sqlite"])
+        store.load()
+        store.close()
+    results["load.sqlite_index"] = best_of(load_sqlite, args.repeat)
+    results["query.due_soon.json"] = best_of(lambda: due_soon(JsonStore(paths["json"]).load()), args.repeat)
+    results["query.due_soon.sqlite"] = best_of(sqlite.due_soon, args.repeat)
+
+    for _, mode in SORT_OPTIONS:
+        fresh = [Board.from_data(data) for _ in range(args.repeat)]
+        results[f"sort.{mode}.cold"] = min(
+            timed(lambda: b.groups.sort(key=lambda g: g.sort_key(mode))) for b in fresh
+        )
+        results[f"sort.{mode}.warm"] = best_of(lambda: board.groups.sort(key=lambda g: g.sort_key(mode)), args.repeat)
+        indexed = Board.from_data(data)
+        indexed.sort(mode)
+        def incremental():
+            for i, group in enumerate(indexed.groups[:100]):
+                indexed.set_title(group, boards.WORDS[i % len(boards.WORDS)] + group.title)
+                indexed.add_item(group, "bench")
+        results[f"sort.{mode}.incremental_100"] = best_of(incremental, args.repeat)
+
+    results["layout.grid_rows"] = best_of(lambda: list(grid_rows(len(board.groups), 3)), args.repeat)
+    results["search.build"] = best_of(lambda: SearchIndex(board), args.repeat)
+    index = SearchIndex(board)
+    results["search.typing"] = best_of(lambda: [index.search(q) for q in ("b", "bu", "buy", "buy c")], args.repeat)
+
+    def bulk_insert():
+        target = Board.from_data(data[:1])
+        for i in range(args.bulk):
+            target.add_item(target.groups[0], f"bulk {i}", False, "")
+    results["insert.model_bulk"] = best_of(bulk_insert, args.repeat)
+    sqlite.close()
+    return results
+
+def start_xvfb():
+    if os.environ.get("DISPLAY") or not sys.platform.startswith("linux"):
+        return None
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        return None
+    display = ":%d" % (90 + os.getpid() % 100)
+    proc = subprocess.Popen([xvfb, display, "-screen", "0", "1600x1200x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    if proc.poll() is not None:
+        return None
+    os.environ["DISPLAY"] = display
+    return proc
+
+def gui_benchmarks(args, tmp):
+    import tkinter as tk
+    import TaskBarn
+
+    path = os.path.join(tmp, "gui.brn")
+    boards.write_board(path, args.groups, args.items, args.due_mix, seed=args.seed)
+    virtual = {"auto": "auto", "on": True, "off": False}[args.virtual]
+    with open(os.path.join(tmp, TaskBarn.CONFIG_FILE), "w") as f:
+        json.dump({"last_file": path, "autosave": False, "virtual_board": virtual,
+                   "item_renderer": args.renderer, "window_size": "1400x1000"}, f)
+
+    cwd = os.getcwd()
+    os.chdir(tmp)
+    root = tk.Tk()
+    try:
+        app = TaskBarn.TaskManagerApp(root)
+        root.update()
+        results = {}
+
+        def drain():
+            if app._load_job is not None:
+                root.after_cancel(app._load_job)
+                app._load_job = None
+            if app._pending_groups:
+                app._build_pending()
+            root.update_idletasks()
+
+        def load():
+            app.clear_tasks()
+            app.load_tasks()
+            drain()
+        results["gui.load_tasks"] = timed(load)
+        results["gui.mode"] = "virtual" if app.virtual is not None else "grid"
+        results["gui.save_tasks"] = timed(app.save_tasks)
+
+        for label, mode in SORT_OPTIONS:
+            def sort():
+                app.sort_method.set(label)
+                app.sort_and_place_tasks()
+                root.update_idletasks()
+            results[f"gui.sort.{mode}"] = timed(sort)
+
+        root.update()
+        tasks = app.virtual.live_tasks() if app.virtual is not None else app.tasks
+        def recolor():
+            for i, task in enumerate(tasks):
+                app.board.set_color(task.group, boards.COLORS[i % len(boards.COLORS)])
+                task.apply_color()
+            root.update_idletasks()
+        results["gui.apply_color"] = timed(recolor)
+        results["gui.apply_color.groups"] = len(tasks)
+
+        def resize():
+            for columns in (2, 5, 3):
+                app.place_tasks(columns)
+                root.update_idletasks()
+        results["gui.place_tasks_resize"] = timed(resize)
+
+        task = tasks[0] if tasks else None
+        if task is not None:
+            def bulk_insert():
+                with app.layout_scheduler.bulk():
+                    for i in range(args.bulk):
+                        task.add_checkbox(f"bulk {i}")
+                root.update_idletasks()
+            results["gui.insert_bulk"] = timed(bulk_insert)
+        app.dirty = False
+        app.autosaver.shutdown()
+        return results
+    finally:
+        root.destroy()
+        os.chdir(cwd)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run TaskBarn benchmarks.")
+    parser.add_argument("--groups", type=int, default=200)
+    parser.add_argument("--items", type=int, default=40)
+    parser.add_argument("--due-mix", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bulk", type=int, default=200, help="items inserted by the bulk insertion benchmarks")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--virtual", choices=("auto", "on", "off"), default="auto")
+    parser.add_argument("--renderer", choices=("widgets", "text"), default="widgets")
+    parser.add_argument("--model-only", action="store_true", help="skip benchmarks that need a display")
+    parser.add_argument("--out", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {k: v for k, v in vars(args).items() if k not in ("out", "model_only")},
+        "results": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        report["results"].update(model_benchmarks(args, tmp))
+        if not args.model_only:
+            xvfb = start_xvfb()
+            try:
+                report["results"].update(gui_benchmarks(args, tmp))
+            except Exception as e:
+                report["gui_error"] = str(e)
+            finally:
+                if xvfb is not None:
+                    xvfb.terminate()
+                    xvfb.wait()
+
+    for name, value in report["results"].items():
+        if isinstance(value, float):
+            print(f"{name:<28} {value * 1000:10.2f} ms")
+        else:
+            print(f"{name:<28} {value:>10}")
+    if "gui_error" in report:
+        print(f"GUI benchmarks skipped: {report['gui_error']}")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import os
+import random
+import sys
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from TaskBarn import Board, Group, Item
+
+COLORS = ["#ffffff", "#ffd6d6", "#d6ffd6", "#d6e4ff", "#fff3c4", "#333333", "#7a4df0"]
+WORDS = "buy call email fix write review plan clean send book check update test ship order pay".split()
+
+def random_due(rng, due_mix):
+    if rng.random() >= due_mix:
+        return ""
+    return (date.today() + timedelta(days=rng.randint(-10, 30))).strftime("%m/%d/%y")
+
+def make_board(groups=200, items=40, due_mix=0.3, colors=COLORS, seed=0):
+    rng = random.Random(seed)
+    board = Board()
+    for g in range(groups):
+        count = max(0, int(rng.gauss(items, items / 3))) if items else 0
+        board.add_group(Group(
+            f"{rng.choice(WORDS).title()} list {g}",
+            items=[
+                Item(" ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 8))), rng.random() < 0.4, random_due(rng, due_mix))
+                for _ in range(count)
+            ],
+            due_date=random_due(rng, due_mix),
+            color=rng.choice(colors),
+            created=f"2024-01-01T00:00:{g:06d}"
+        ))
+    return board
+
+def write_board(path, groups=200, items=40, due_mix=0.3, colors=COLORS, seed=0, fmt="json"):
+    from TaskBarn import JsonStore, write_brn2
+    board = make_board(groups, items, due_mix, colors, seed)
+    if fmt == "v2":
+        write_brn2(path, board)
+    else:
+        JsonStore(path).save(board)
+    return board
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Write a synthetic TaskBarn board.")
+    parser.add_argument("path")
+    parser.add_argument("--groups", type=int, default=200)
+    parser.add_argument("--items", type=int, default=40)
+    parser.add_argument("--due-mix", type=float, default=0.3)
+    parser.add_argument("--colors", default=",".join(COLORS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", choices=("json", "v2"), default="json")
+    args = parser.parse_args()
+    board = write_board(args.path, args.groups, args.items, args.due_mix, args.colors.split(","), args.seed, args.format)
+    print(f"Wrote {len(board.groups)} groups / {sum(g.item_count() for g in board.groups)} items to {args.path}")
@@ -0,0 +1,41 @@
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from TaskBarn import Board, Group, Item
+
+DONE = date(2024, 3, 1).toordinal()
+
+def due(days):
+    return (date.today() + timedelta(days=days)).strftime("%m/%d/%y")
+
+@pytest.fixture
+def board():
+    return Board([
+        Group("Garden", [Item("weed", False, due(2)), Item("mow", True, due(1), DONE), Item("rake", True, "")],
+              due_date=due(3), color="#88cc88", created="2024-01-01T09:00:00"),
+        Group("Empty", created="2024-01-02T09:00:00", collapsed=True),
+        Group("Books", [Item("Dune", False, due(30)), Item("Emma", False, due(5)), Item("Ulysses", True, "")],
+              created="2024-01-03T09:00:00", collapsed=True),
+        Group("Ünïcode ✓", [Item("naïve café", False, ""), Item("Kyōto", False, due(-1))],
+              due_date=due(10), created="2024-01-04T09:00:00"),
+    ])
+
+@pytest.fixture
+def reopen():
+    stores = []
+
+    def reopen(store_class, path):
+        store = store_class(path)
+        board = store.load()
+        store.loaded(board)
+        stores.append(store)
+        return store, board
+
+    yield reopen
+    for store in stores:
+        store.close()
@@ -0,0 +1,68 @@
+import TaskBarn
+from TaskBarn import Board, Brn2Reader, Brn2Store, UndoHistory, is_brn2
+
+def test_round_trip(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brn")
+    Brn2Store(path).save(board)
+    assert is_brn2(path)
+    _, loaded = reopen(Brn2Store, path)
+    loaded.load_all()
+    assert loaded.to_data() == board.to_data()
+
+def test_done_on_flag(tmp_path, board):
+    path = str(tmp_path / "tasks.brn")
+    Brn2Store(path).save(board)
+    reader = Brn2Reader(path)
+    items = reader.read_items(0)
+    reader.close()
+    assert [item.done_on for item in items] == [item.done_on for item in board.groups[0].items]
+    assert [item.checked for item in items] == [False, True, True]
+    assert [item.deadline_ord for item in items] == [item.deadline_ord for item in board.groups[0].items]
+
+def test_groups_load_lazily(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brn")
+    Brn2Store(path).save(board)
+    _, loaded = reopen(Brn2Store, path)
+    assert not any(group.is_loaded() for group in loaded.groups)
+    assert [(g.item_count(), g.done_count()) for g in loaded.groups] == [(3, 2), (0, 0), (3, 1), (2, 0)]
+    assert [g.id for g in loaded.groups] == [g.id for g in board.groups]
+    assert loaded.groups[3].items[0].label == "naïve café"
+    assert not loaded.groups[0].is_loaded()
+
+def test_save_after_partial_lazy_load(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brn")
+    Brn2Store(path).save(board)
+    store, loaded = reopen(Brn2Store, path)
+    group = loaded.groups[0]
+    loaded.set_item_text(group, group.items[0], "weed beds")
+    loaded.remove_item(group, group.items[2])
+    loaded.remove_group(loaded.groups[1])
+    expected = loaded.to_data()
+    store.save(loaded)
+    _, again = reopen(Brn2Store, path)
+    again.load_all()
+    assert again.to_data() == expected
+
+def test_undo_delete_of_unread_group(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brn")
+    Brn2Store(path).save(board)
+    store, loaded = reopen(Brn2Store, path)
+    loaded.history = UndoHistory()
+    loaded.remove_group(loaded.groups[0])
+    store.save(loaded)
+    loaded.history.undo(loaded)
+    store.save(loaded)
+    _, again = reopen(Brn2Store, path)
+    again.load_all()
+    assert again.to_data() == board.to_data()
+
+def test_reads_version_3_files(tmp_path, board, reopen, monkeypatch):
+    path = str(tmp_path / "tasks.brn")
+    small = Board.from_data([dict(data, id=i + 1) for i, data in enumerate(board.to_data())])
+    monkeypatch.setattr(TaskBarn, "BRN2_VERSION", 3)
+    monkeypatch.setattr(TaskBarn, "_BRN2_INDEX", TaskBarn._BRN2_INDEX_V3)
+    Brn2Store(path).save(small)
+    monkeypatch.undo()
+    _, loaded = reopen(Brn2Store, path)
+    loaded.load_all()
+    assert loaded.to_data() == small.to_data()
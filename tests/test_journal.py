@@ -0,0 +1,92 @@
+import json
+import os
+
+from TaskBarn import Group, Item, JournalStore, JsonStore, open_store
+
+def test_first_save_writes_snapshot(tmp_path, board):
+    path = str(tmp_path / "tasks.brn")
+    JournalStore(path).save(board)
+    assert not os.path.exists(path + ".log")
+    assert JsonStore(path).load().to_data() == board.to_data()
+
+def test_replay_edits_and_deletions(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brn")
+    JournalStore(path).save(board)
+    store, loaded = reopen(JournalStore, path)
+    garden, empty, books, _ = loaded.groups
+    loaded.set_title(books, "Reading")
+    loaded.remove_item(garden, garden.items[0])
+    loaded.remove_group(empty)
+    loaded.add_group(Group("New", [Item("one", False, "")]))
+    store.save(loaded)
+    with open(path + ".log", encoding="utf-8") as f:
+        ops = [json.loads(line)["op"] for line in f]
+    assert sorted(ops) == ["del", "put", "put", "put"]
+    assert len(JsonStore(path).load().groups) == 4
+    _, again = reopen(JournalStore, path)
+    assert again.to_data() == loaded.to_data()
+
+def test_unchanged_save_appends_nothing(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brn")
+    JournalStore(path).save(board)
+    store, loaded = reopen(JournalStore, path)
+    loaded.set_title(loaded.groups[0], loaded.groups[0].title)
+    store.save(loaded)
+    assert not os.path.exists(path + ".log")
+
+def test_compaction_folds_log_into_snapshot(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brn")
+    JournalStore(path).save(board)
+    store = JournalStore(path, compact_bytes=200)
+    loaded = store.load()
+    store.loaded(loaded)
+    for i in range(10):
+        loaded.add_item(loaded.groups[2], f"chapter {i}")
+        store.save(loaded)
+    loaded.remove_group(loaded.groups[1])
+    store.save(loaded)
+    store.save(loaded)
+    store.wait()
+    assert store.compactions >= 1
+    assert not os.path.exists(path + ".log.compacting")
+    _, again = reopen(JournalStore, path)
+    assert again.to_data() == loaded.to_data()
+
+def test_replays_interrupted_compaction(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brn")
+    JournalStore(path).save(board)
+    store, loaded = reopen(JournalStore, path)
+    loaded.set_title(loaded.groups[0], "Yard")
+    store.save(loaded)
+    os.replace(path + ".log", path + ".log.compacting")
+    loaded.remove_group(loaded.groups[1])
+    store.save(loaded)
+    _, again = reopen(JournalStore, path)
+    assert again.to_data() == loaded.to_data()
+
+def test_append_after_torn_tail(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brn")
+    JournalStore(path).save(board)
+    store, loaded = reopen(JournalStore, path)
+    loaded.set_title(loaded.groups[0], "Yard")
+    store.save(loaded)
+    loaded.set_title(loaded.groups[2], "Reading")
+    store.save(loaded)
+    with open(path + ".log", "r+b") as f:
+        f.truncate(f.seek(0, os.SEEK_END) - 5)
+    store, loaded = reopen(JournalStore, path)
+    assert [group.title for group in loaded.groups] == ["Yard", "Empty", "Books", "Ünïcode ✓"]
+    loaded.set_title(loaded.groups[1], "Plans")
+    store.save(loaded)
+    _, again = reopen(JournalStore, path)
+    assert again.to_data() == loaded.to_data()
+
+def test_open_store_detects_journal(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brn")
+    JournalStore(path).save(board)
+    store, loaded = reopen(JournalStore, path)
+    loaded.set_title(loaded.groups[0], "Yard")
+    store.save(loaded)
+    detected = open_store(path, "json")
+    assert isinstance(detected, JournalStore)
+    assert detected.load().to_data() == loaded.to_data()
@@ -0,0 +1,89 @@
+from TaskBarn import Group, JsonStore, SqliteStore, UndoHistory, due_soon, export_json, import_json
+
+def edit(board):
+    garden, empty, books, _ = board.groups
+    board.set_title(books, "Reading")
+    board.set_item_text(garden, garden.items[0], "weed beds")
+    board.remove_item(garden, garden.items[1])
+    board.add_item(garden, "water", deadline=garden.items[0].deadline)
+    board.remove_group(empty)
+
+def test_round_trip(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brndb")
+    SqliteStore(path).save(board)
+    _, loaded = reopen(SqliteStore, path)
+    assert not any(group.is_loaded() for group in loaded.groups)
+    assert [(g.item_count(), g.done_count()) for g in loaded.groups] == [(3, 2), (0, 0), (3, 1), (2, 0)]
+    loaded.load_all()
+    assert loaded.to_data() == board.to_data()
+
+def test_due_soon_matches_board(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brndb")
+    SqliteStore(path).save(board)
+    store, _ = reopen(SqliteStore, path)
+    rows = store.due_soon()
+    assert rows == due_soon(board)
+    assert [label for _, _, label in rows] == ["weed", None, "Emma"]
+
+def test_snapshot_writes_only_changed_rows(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brndb")
+    SqliteStore(path).save(board)
+    store, loaded = reopen(SqliteStore, path)
+    garden = loaded.groups[0]
+    loaded.set_item_text(garden, garden.items[0], "weed beds")
+    loaded.set_title(loaded.groups[2], "Reading")
+    data = store.snapshot(loaded)
+    assert not data["full"]
+    assert len(data["items"]) == 1 and data["items"][0][2] == "weed beds"
+    assert len(data["groups"]) == 1 and data["groups"][0][0] == "Reading"
+    assert data["new_groups"] == data["new_items"] == data["deleted_items"] == data["replace_items"] == []
+    assert not loaded.groups[2].is_loaded()
+    store.write(data)
+    assert store.snapshot(loaded)["changed"] == []
+
+def test_save_after_partial_lazy_load(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brndb")
+    SqliteStore(path).save(board)
+    store, loaded = reopen(SqliteStore, path)
+    edit(loaded)
+    assert not loaded.groups[1].is_loaded()
+    store.save(loaded)
+    edit(board)
+    _, again = reopen(SqliteStore, path)
+    again.load_all()
+    assert again.to_data() == board.to_data()
+    assert store.due_soon() == due_soon(board)
+
+def test_undo_delete_of_unread_group(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brndb")
+    SqliteStore(path).save(board)
+    store, loaded = reopen(SqliteStore, path)
+    loaded.history = UndoHistory()
+    loaded.remove_group(loaded.groups[2])
+    store.save(loaded)
+    loaded.history.undo(loaded)
+    store.save(loaded)
+    _, again = reopen(SqliteStore, path)
+    again.load_all()
+    assert again.to_data() == board.to_data()
+
+def test_new_group_in_overlapping_snapshots(tmp_path, board, reopen):
+    path = str(tmp_path / "tasks.brndb")
+    SqliteStore(path).save(board)
+    store, loaded = reopen(SqliteStore, path)
+    group = loaded.add_group(Group("Later"))
+    first = store.snapshot(loaded)
+    loaded.set_title(group, "Sooner")
+    second = store.snapshot(loaded)
+    assert first["new_groups"] and second["new_groups"]
+    store.write(first)
+    store.write(second)
+    _, again = reopen(SqliteStore, path)
+    again.load_all()
+    assert again.to_data() == loaded.to_data()
+
+def test_json_import_export(tmp_path, board):
+    JsonStore(str(tmp_path / "tasks.brn")).save(board)
+    import_json(str(tmp_path / "tasks.brn"), str(tmp_path / "tasks.brndb"))
+    export_json(str(tmp_path / "tasks.brndb"), str(tmp_path / "copy.brn"))
+    assert JsonStore(str(tmp_path / "copy.brn")).load().to_data() == board.to_data()